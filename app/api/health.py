@@ -5,12 +5,14 @@ Provides endpoints for monitoring the API health and status.
 """
 
 import logging
-from datetime import datetime
+import time
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Depends, Response
 
-from app.config import settings
+from app.config import Settings, get_settings
 from app.models import HealthCheckResponse
+from app.services import sheets_service
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -18,12 +20,40 @@ logger = logging.getLogger(__name__)
 # Create router for health endpoints
 router = APIRouter()
 
+# Health check body with only the timestamp left to fill in
+HEALTH_TEMPLATE = (
+    b'{"status":"healthy","version":'
+    + orjson.dumps(get_settings().API_VERSION).replace(b"%", b"%%")
+    + b',"timestamp":"%b"}'
+)
+
+# Second the cached health body was rendered for, and the body itself
+_health_cache = [-1, b""]
+
+
+def _health_body() -> bytes:
+    """
+    Get the health check body, re-rendering it at most once per second.
+    
+    Returns:
+        JSON encoded health status
+    """
+    now = int(time.time())
+    if now != _health_cache[0]:
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)).encode()
+        _health_cache[0] = now
+        _health_cache[1] = HEALTH_TEMPLATE % timestamp
+    return _health_cache[1]
+
 
 @router.get("/", response_model=dict)
-async def root():
+async def root(settings: Settings = Depends(get_settings)):
     """
     Root endpoint providing basic API information.
     
+    Args:
+        settings: Application settings
+    
     Returns:
         Basic information about the API
     """
@@ -36,15 +66,28 @@ async def root():
 
 
 @router.get("/health", response_model=HealthCheckResponse)
-async def health_check():
+async def health_check() -> Response:
     """
     Health check endpoint for monitoring.
     
+    The response body is precomputed and refreshed once per second, when
+    its timestamp changes.
+    
     Returns:
         Health status information
     """
-    return HealthCheckResponse(
-        status="healthy",
-        version=settings.API_VERSION,
-        timestamp=datetime.utcnow().isoformat()
-    )
+    return Response(content=_health_body(), media_type="application/json")
+
+
+@router.get("/stats", response_model=dict)
+async def api_stats():
+    """
+    Google Sheets API usage since startup.
+    
+    Counts every request sent to the Google Sheets API by this process,
+    including retries, per operation.
+    
+    Returns:
+        Request and retry counts keyed by operation name
+    """
+    return {"sheets_api": sheets_service.get_api_stats()}
@@ -11,11 +11,28 @@ Handles all endpoints related to Google Sheets operations:
 import logging
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Body, Header, HTTPException, Path, Query
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Path, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
-from app.api.utils import get_worksheet_from_ids, log_request, log_success
-from app.models import BulkOperationResponse, SheetGetRowsOptions
-from app.services import sheets_service
+from app.api.utils import (
+    ROWS_REQUEST_BODY,
+    etag_response,
+    get_many_worksheets,
+    get_worksheet_from_ids,
+    log_request,
+    log_success,
+    parse_rows_body,
+    stream_json_array,
+)
+from app.config import Settings, get_settings
+from app.models import BatchGetRequest, BulkOperationResponse, SheetGetRowsOptions
+from app.services import (
+    cache_get_or_set,
+    invalidate_document_cache,
+    make_cache_key,
+    sheets_service,
+    single_flight,
+)
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -24,27 +41,38 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get("/{document_id}/{sheet_id}", response_model=List[Dict[str, Any]])
+@router.get("/{document_id}/{sheet_id}")
 async def get_rows(
+    request: Request,
     document_id: str = Path(..., description="Google Spreadsheet document ID"),
     sheet_id: str = Path(..., description="Sheet ID, index, or title"),
     x_google_access_token: Optional[str] = Header(None, alias="x-google-access-token"),
     offset: int = Query(0, ge=0, description="Number of rows to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of rows to return"),
-) -> List[Dict[str, Any]]:
+    stream: bool = Query(
+        False,
+        description="Stream rows as they are encoded (bypasses caching and ETag)"
+    ),
+    settings: Settings = Depends(get_settings),
+) -> Response:
     """
     Get rows from a Google Sheet with optional pagination.
     
     Retrieves data from a Google Sheet with support for:
     - Pagination using offset and limit
     - Authentication via OAuth2 token or API key
+    - Conditional requests via ETag/If-None-Match
+    - Streamed responses for large pages
     
     Args:
+        request: Incoming request
         document_id: The Google Spreadsheet document ID from the URL
         sheet_id: Sheet identifier (can be numeric ID, index, or title)
         x_google_access_token: OAuth2 access token (optional)
         offset: Number of rows to skip from the beginning
         limit: Maximum number of rows to return (max 1000)
+        stream: Stream the response instead of buffering it
+        settings: Application settings
         
     Returns:
         List of row dictionaries with column headers as keys
@@ -52,9 +80,33 @@ async def get_rows(
     Raises:
         HTTPException: If document/sheet is not accessible or other errors occur
     """
-    log_request("GET", document_id, sheet_id, offset=offset, limit=limit)
+    log_request("GET", document_id, sheet_id, offset=offset, limit=limit, stream=stream or None)
     
-    try:
+    if stream:
+        try:
+            # Get document and worksheet
+            document, worksheet = await get_worksheet_from_ids(
+                document_id, sheet_id, x_google_access_token
+            )
+            
+            # Get rows lazily and encode them as they are sent
+            options = SheetGetRowsOptions(offset=offset, limit=limit)
+            rows = await sheets_service.iter_sheet_rows(worksheet, options)
+            
+            log_success("Streaming rows", document.title, worksheet.title)
+            
+            return StreamingResponse(stream_json_array(rows), media_type="application/json")
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error streaming rows: {str(e)}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"Internal server error: {str(e)}"
+            )
+    
+    async def load_rows() -> List[Dict[str, Any]]:
         # Get document and worksheet
         document, worksheet = await get_worksheet_from_ids(
             document_id, sheet_id, x_google_access_token
@@ -73,6 +125,21 @@ async def get_rows(
         )
         
         return rows
+    
+    try:
+        cache_key = make_cache_key(
+            document_id, sheet_id, x_google_access_token, "rows", offset, limit
+        )
+        rows = await single_flight(
+            cache_key,
+            lambda: cache_get_or_set(
+                cache_key, load_rows, settings.CACHE_TTL_ROWS, document_id=document_id
+            ),
+            document_id=document_id
+        )
+        
+        # Serialize directly, skipping response model validation
+        return etag_response(request, rows)
         
     except HTTPException:
         raise
@@ -84,12 +151,14 @@ async def get_rows(
         )
 
 
-@router.get("/{document_id}/{sheet_id}/info", response_model=Dict[str, Any])
+@router.get("/{document_id}/{sheet_id}/info")
 async def get_sheet_info(
+    request: Request,
     document_id: str = Path(..., description="Google Spreadsheet document ID"),
     sheet_id: str = Path(..., description="Sheet ID, index, or title"),
-    x_google_access_token: Optional[str] = Header(None, alias="x-google-access-token")
-) -> Dict[str, Any]:
+    x_google_access_token: Optional[str] = Header(None, alias="x-google-access-token"),
+    settings: Settings = Depends(get_settings),
+) -> Response:
     """
     Get metadata information about a Google Sheet.
     
@@ -100,9 +169,11 @@ async def get_sheet_info(
     - Sheet configuration
     
     Args:
+        request: Incoming request
         document_id: The Google Spreadsheet document ID from the URL
         sheet_id: Sheet identifier (can be numeric ID, index, or title)
         x_google_access_token: OAuth2 access token (optional)
+        settings: Application settings
         
     Returns:
         Dictionary containing sheet metadata
@@ -112,7 +183,7 @@ async def get_sheet_info(
     """
     log_request("GET INFO", document_id, sheet_id)
     
-    try:
+    async def load_info() -> Dict[str, Any]:
         # Get document and worksheet
         document, worksheet = await get_worksheet_from_ids(
             document_id, sheet_id, x_google_access_token
@@ -124,6 +195,18 @@ async def get_sheet_info(
         log_success("Retrieved info", document.title, worksheet.title)
         
         return sheet_info
+    
+    try:
+        cache_key = make_cache_key(document_id, sheet_id, x_google_access_token, "info")
+        sheet_info = await single_flight(
+            cache_key,
+            lambda: cache_get_or_set(
+                cache_key, load_info, settings.CACHE_TTL_INFO, document_id=document_id
+            ),
+            document_id=document_id
+        )
+        
+        return etag_response(request, sheet_info)
         
     except HTTPException:
         raise
@@ -135,23 +218,27 @@ async def get_sheet_info(
         )
 
 
-@router.get("/{document_id}/{sheet_id}/{row_id}", response_model=Dict[str, Any])
+@router.get("/{document_id}/{sheet_id}/{row_id}", response_model=None)
 async def get_row(
+    request: Request,
     document_id: str = Path(..., description="Google Spreadsheet document ID"),
     sheet_id: str = Path(..., description="Sheet ID, index, or title"),
     row_id: int = Path(..., ge=0, description="Row index (0-based)"),
-    x_google_access_token: Optional[str] = Header(None, alias="x-google-access-token")
-) -> Dict[str, Any]:
+    x_google_access_token: Optional[str] = Header(None, alias="x-google-access-token"),
+    settings: Settings = Depends(get_settings),
+) -> Response:
     """
     Get a specific row from a Google Sheet.
     
     Retrieves a single row by its index (0-based).
     
     Args:
+        request: Incoming request
         document_id: The Google Spreadsheet document ID from the URL
         sheet_id: Sheet identifier (can be numeric ID, index, or title)
         row_id: Zero-based row index
         x_google_access_token: OAuth2 access token (optional)
+        settings: Application settings
         
     Returns:
         Dictionary containing row data with column headers as keys
@@ -161,7 +248,7 @@ async def get_row(
     """
     log_request("GET ROW", document_id, sheet_id, row_id=row_id)
     
-    try:
+    async def load_row() -> Dict[str, Any]:
         # Get document and worksheet
         document, worksheet = await get_worksheet_from_ids(
             document_id, sheet_id, x_google_access_token
@@ -173,6 +260,20 @@ async def get_row(
         log_success(f"Retrieved row {row_id}", document.title, worksheet.title)
         
         return row
+    
+    try:
+        cache_key = make_cache_key(
+            document_id, sheet_id, x_google_access_token, "row", row_id
+        )
+        row = await single_flight(
+            cache_key,
+            lambda: cache_get_or_set(
+                cache_key, load_row, settings.CACHE_TTL_ROWS, document_id=document_id
+            ),
+            document_id=document_id
+        )
+        
+        return etag_response(request, row)
         
     except HTTPException:
         raise
@@ -184,14 +285,14 @@ async def get_row(
         )
 
 
-@router.put("/{document_id}/{sheet_id}/{row_id}", response_model=Dict[str, Any])
+@router.put("/{document_id}/{sheet_id}/{row_id}", response_model=None)
 async def update_row(
     document_id: str = Path(..., description="Google Spreadsheet document ID"),
     sheet_id: str = Path(..., description="Sheet ID, index, or title"),
     row_id: int = Path(..., ge=0, description="Row index (0-based)"),
     body: Dict[str, Any] = Body(..., description="Row data to update"),
     x_google_access_token: Optional[str] = Header(None, alias="x-google-access-token")
-) -> Dict[str, Any]:
+) -> Response:
     """
     Update a specific row in a Google Sheet.
     
@@ -220,10 +321,12 @@ async def update_row(
         
         # Update row
         updated_row = await sheets_service.update_row(worksheet, row_id, body)
+        await invalidate_document_cache(document_id)
         
         log_success(f"Updated row {row_id}", document.title, worksheet.title)
         
-        return updated_row
+        # Serialize directly, skipping jsonable_encoder
+        return ORJSONResponse(updated_row)
         
     except HTTPException:
         raise
@@ -235,13 +338,76 @@ async def update_row(
         )
 
 
-@router.post("/{document_id}/{sheet_id}", response_model=Dict[str, Any])
+# Registered before create_row so "/{document_id}/batch" is not
+# captured as a sheet named "batch"
+@router.post("/{document_id}/batch", response_model=None)
+async def batch_get_rows(
+    document_id: str = Path(..., description="Google Spreadsheet document ID"),
+    body: BatchGetRequest = Body(..., description="Sheets and pages to read"),
+    x_google_access_token: Optional[str] = Header(None, alias="x-google-access-token")
+) -> Response:
+    """
+    Get rows from several sheets of a document in one request.
+    
+    All requested pages are fetched with a single Google Sheets API
+    call instead of one call per sheet.
+    
+    Args:
+        document_id: The Google Spreadsheet document ID from the URL
+        body: List of sheet identifiers with their offset and limit
+        x_google_access_token: OAuth2 access token (optional)
+        
+    Returns:
+        List with the sheet ID and rows of each requested sheet, in
+        request order
+        
+    Raises:
+        HTTPException: If document/sheet is not accessible or other errors occur
+    """
+    log_request("BATCH GET", document_id, "batch", count=len(body.sheets))
+    
+    try:
+        # Get document and every requested worksheet
+        document, worksheets = await get_many_worksheets(
+            document_id, [spec.sheet_id for spec in body.sheets], x_google_access_token
+        )
+        requests = [
+            (worksheet, SheetGetRowsOptions(offset=spec.offset, limit=spec.limit))
+            for spec, worksheet in zip(body.sheets, worksheets)
+        ]
+        
+        # Get all pages in one call
+        results = await sheets_service.get_many_sheet_rows(document, requests)
+        
+        log_success(
+            f"Batch retrieved {len(results)} sheets",
+            document.title,
+            "batch"
+        )
+        
+        # Serialize directly, skipping jsonable_encoder
+        return ORJSONResponse([
+            {"sheet_id": spec.sheet_id, "rows": rows}
+            for spec, rows in zip(body.sheets, results)
+        ])
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error batch getting rows: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+
+@router.post("/{document_id}/{sheet_id}", response_model=None)
 async def create_row(
     document_id: str = Path(..., description="Google Spreadsheet document ID"),
     sheet_id: str = Path(..., description="Sheet ID, index, or title"),
     body: Dict[str, Any] = Body(..., description="Row data to create"),
     x_google_access_token: Optional[str] = Header(None, alias="x-google-access-token")
-) -> Dict[str, Any]:
+) -> Response:
     """
     Create a new row in a Google Sheet.
     
@@ -269,10 +435,12 @@ async def create_row(
         
         # Create new row
         new_row = await sheets_service.create_row(worksheet, body)
+        await invalidate_document_cache(document_id)
         
         log_success("Created new row", document.title, worksheet.title)
         
-        return new_row
+        # Serialize directly, skipping jsonable_encoder
+        return ORJSONResponse(new_row)
         
     except HTTPException:
         raise
@@ -284,12 +452,16 @@ async def create_row(
         )
 
 
-@router.put("/{document_id}/{sheet_id}/{row_id}/bulk", response_model=BulkOperationResponse)
+@router.put(
+    "/{document_id}/{sheet_id}/{row_id}/bulk",
+    response_model=BulkOperationResponse,
+    openapi_extra=ROWS_REQUEST_BODY
+)
 async def update_rows_bulk(
     document_id: str = Path(..., description="Google Spreadsheet document ID"),
     sheet_id: str = Path(..., description="Sheet ID, index, or title"),
     row_id: int = Path(..., ge=0, description="Starting row index (0-based)"),
-    body: List[Dict[str, Any]] = Body(..., description="List of row data to update"),
+    body: List[Dict[str, Any]] = Depends(parse_rows_body),
     x_google_access_token: Optional[str] = Header(None, alias="x-google-access-token")
 ) -> BulkOperationResponse:
     """
@@ -321,6 +493,7 @@ async def update_rows_bulk(
         
         # Update rows in bulk
         updated_count = await sheets_service.update_rows_bulk(worksheet, row_id, body)
+        await invalidate_document_cache(document_id)
         
         log_success(
             f"Bulk updated {updated_count} rows starting from {row_id}",
@@ -344,11 +517,15 @@ async def update_rows_bulk(
         )
 
 
-@router.post("/{document_id}/{sheet_id}/bulk", response_model=BulkOperationResponse)
+@router.post(
+    "/{document_id}/{sheet_id}/bulk",
+    response_model=BulkOperationResponse,
+    openapi_extra=ROWS_REQUEST_BODY
+)
 async def create_rows_bulk(
     document_id: str = Path(..., description="Google Spreadsheet document ID"),
     sheet_id: str = Path(..., description="Sheet ID, index, or title"),
-    body: List[Dict[str, Any]] = Body(..., description="List of row data to create"),
+    body: List[Dict[str, Any]] = Depends(parse_rows_body),
     x_google_access_token: Optional[str] = Header(None, alias="x-google-access-token")
 ) -> BulkOperationResponse:
     """
@@ -379,6 +556,7 @@ async def create_rows_bulk(
         
         # Create rows in bulk
         created_count = await sheets_service.create_rows_bulk(worksheet, body)
+        await invalidate_document_cache(document_id)
         
         log_success(
             f"Bulk created {created_count} rows",
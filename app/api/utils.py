@@ -4,15 +4,33 @@ Utility functions for API routes.
 Common functionality shared across different route modules.
 """
 
+import hashlib
 import logging
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
-from fastapi import Header, HTTPException
+import orjson
+from fastapi import Header, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from app.services import sheets_service
+from app.config import settings
+from app.services import sheets_service, token_fingerprint
 
 logger = logging.getLogger(__name__)
 
+# Size of the chunks written by streamed JSON responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Validator for bulk row payloads, built once
+ROWS_ADAPTER = TypeAdapter(List[Dict[str, Any]])
+
+# OpenAPI request body for routes reading rows with parse_rows_body
+ROWS_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": ROWS_ADAPTER.json_schema()}},
+    }
+}
 
 async def get_worksheet_from_ids(
     document_id: str,
@@ -22,6 +40,9 @@ async def get_worksheet_from_ids(
     """
     Helper function to get worksheet from document and sheet IDs.
     
+    Resolved worksheets are cached for CACHE_TTL_WORKSHEET seconds so
+    repeated requests skip the document metadata call.
+    
     Args:
         document_id: Google Spreadsheet document ID
         sheet_id: Sheet identifier (ID, index, or title)
@@ -33,9 +54,15 @@ async def get_worksheet_from_ids(
     Raises:
         HTTPException: If document or sheet cannot be accessed
     """
+    cache_key = (document_id, sheet_id, token_fingerprint(access_token))
+    cached = sheets_service.worksheet_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
         document = await sheets_service.get_document(document_id, access_token)
         worksheet = await sheets_service.get_sheet(document, sheet_id)
+        sheets_service.worksheet_cache[cache_key] = (document, worksheet)
         return document, worksheet
     except HTTPException:
         raise
@@ -47,6 +74,44 @@ async def get_worksheet_from_ids(
         )
 
 
+async def get_many_worksheets(
+    document_id: str,
+    sheet_ids: List[str],
+    access_token: Optional[str] = None
+):
+    """
+    Helper function to get several worksheets of one document.
+    
+    The document is opened once; the worksheets are then resolved from
+    its metadata without further API calls.
+    
+    Args:
+        document_id: Google Spreadsheet document ID
+        sheet_ids: Sheet identifiers (ID, index, or title)
+        access_token: OAuth2 access token (optional)
+        
+    Returns:
+        tuple: (document, worksheets) with worksheets in sheet_ids order
+        
+    Raises:
+        HTTPException: If document or any sheet cannot be accessed
+    """
+    try:
+        document = await sheets_service.get_document(document_id, access_token)
+        worksheets = [
+            await sheets_service.get_sheet(document, sheet_id) for sheet_id in sheet_ids
+        ]
+        return document, worksheets
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting worksheets: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+
 def log_request(endpoint: str, document_id: str, sheet_id: str, **kwargs):
     """
     Log API request with consistent format.
@@ -57,11 +122,14 @@ def log_request(endpoint: str, document_id: str, sheet_id: str, **kwargs):
         sheet_id: Sheet identifier
         **kwargs: Additional parameters to log
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     params = ", ".join([f"{k}={v}" for k, v in kwargs.items() if v is not None])
-    log_msg = f"{endpoint} /{document_id}/{sheet_id}"
     if params:
-        log_msg += f" - {params}"
-    logger.info(log_msg)
+        logger.info("%s /%s/%s - %s", endpoint, document_id, sheet_id, params)
+    else:
+        logger.info("%s /%s/%s", endpoint, document_id, sheet_id)
 
 
 def log_success(action: str, document_title: str, sheet_title: str, details: str = ""):
@@ -74,7 +142,102 @@ def log_success(action: str, document_title: str, sheet_title: str, details: str
         sheet_title: Sheet title
         details: Additional details
     """
-    log_msg = f"{action} in {document_title}/{sheet_title}"
     if details:
-        log_msg += f" - {details}"
-    logger.info(log_msg)
+        logger.info("%s in %s/%s - %s", action, document_title, sheet_title, details)
+    else:
+        logger.info("%s in %s/%s", action, document_title, sheet_title)
+
+
+def etag_response(request: Request, content: Any) -> Response:
+    """
+    Build a JSON response carrying an ETag, honouring If-None-Match.
+
+    The ETag is a hash of the serialized body, so a client that already
+    holds the same payload gets an empty 304 Not Modified response. It is
+    weak since the same payload may be sent gzip-compressed or not, and
+    If-None-Match compares weak and strong tags alike.
+    
+    Args:
+        request: Incoming request (used for the If-None-Match header)
+        content: JSON-serializable response payload
+        
+    Returns:
+        304 response if the client's copy is current, otherwise a 200
+        JSON response with ETag and Cache-Control headers
+    """
+    body = orjson.dumps(content)
+    opaque_tag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {
+        "ETag": f"W/{opaque_tag}",
+        "Cache-Control": f"private, max-age={settings.HTTP_CACHE_MAX_AGE}",
+    }
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        client_etags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if opaque_tag in client_etags or "*" in client_etags:
+            return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def stream_json_array(rows: Iterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """
+    Encode rows as a JSON array incrementally.
+    
+    Rows are serialized one at a time with orjson and flushed in chunks
+    of about STREAM_CHUNK_SIZE bytes, so the full body is never held in
+    memory.
+    
+    Args:
+        rows: Iterator over row dictionaries
+        
+    Yields:
+        Chunks of the JSON document
+    """
+    buffer = bytearray(b"[")
+    first = True
+    for row in rows:
+        if not first:
+            buffer += b","
+        buffer += orjson.dumps(row)
+        first = False
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+    yield bytes(buffer)
+
+
+async def parse_rows_body(request: Request) -> List[Dict[str, Any]]:
+    """
+    Parse a bulk request body into a list of row dictionaries.
+    
+    The raw body is decoded with orjson and validated in a single pass,
+    which is much cheaper than FastAPI's generic body handling for
+    payloads of thousands of rows.
+    
+    Args:
+        request: Incoming request
+        
+    Returns:
+        List of row data dictionaries
+        
+    Raises:
+        RequestValidationError: If the body is not a JSON list of objects
+    """
+    raw = await request.body()
+    try:
+        return ROWS_ADAPTER.validate_python(orjson.loads(raw))
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError([{
+            "type": "json_invalid",
+            "loc": ("body", e.pos),
+            "msg": "JSON decode error",
+            "input": {},
+            "ctx": {"error": e.msg},
+        }])
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
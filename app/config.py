@@ -5,37 +5,64 @@ This module handles all environment variables and configuration
 for the Sheetful API application.
 """
 
-import os
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
 
-from dotenv import load_dotenv
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load environment variables from .env file
-load_dotenv()
 
-
-class Settings:
-    """Application settings configuration."""
+class Settings(BaseSettings):
+    """
+    Application settings configuration.
+    
+    Values are read from the environment (or a .env file) and validated
+    once, when the settings object is created.
+    """
+    
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
     
     # Google API Settings
-    GOOGLE_API_KEY: Optional[str] = os.getenv("GOOGLE_API_KEY")
-    GOOGLE_SERVICE_ACCOUNT_KEY: Optional[str] = os.getenv("GOOGLE_SERVICE_ACCOUNT_KEY")
+    GOOGLE_API_KEY: Optional[str] = None
+    GOOGLE_SERVICE_ACCOUNT_KEY: Optional[str] = None
     
     # Server Settings
-    PORT: int = int(os.getenv("PORT", 8000))
-    HOST: str = os.getenv("HOST", "0.0.0.0")
-    DEBUG: bool = os.getenv("DEBUG", "false").lower() == "true"
+    PORT: int = 8000
+    HOST: str = "0.0.0.0"
+    WORKERS: int = 1
+    DEBUG: bool = False
     
     # API Settings
     API_TITLE: str = "Sheetful API"
     API_DESCRIPTION: str = "The easiest way to turn your Google Sheet into a RESTful API"
     API_VERSION: str = "0.1.0"
     
+    # Google Sheets API Settings
+    SHEETS_POOL_MAXSIZE: int = 20
+    SHEETS_ASYNC_HTTP: bool = False
+    SHEETS_THREADPOOL_SIZE: int = 64
+    SHEETS_READ_QPS: float = 5.0
+    SHEETS_WRITE_QPS: float = 1.0
+    SHEETS_RETRY_ATTEMPTS: int = 5
+    SHEETS_RETRY_MAX_WAIT: float = 16.0
+    
     # CORS Settings
-    ALLOWED_ORIGINS: list = ["*"]  # Configure this for production
+    ALLOWED_ORIGINS: List[str] = ["*"]  # Configure this for production
+    
+    # Response Compression Settings
+    GZIP_MINIMUM_SIZE: int = 1024
     
     # Logging Settings
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str = "INFO"
+    
+    # Cache Settings
+    REDIS_URL: Optional[str] = None
+    CACHE_TTL_ROWS: int = 60
+    CACHE_TTL_INFO: int = 300
+    CACHE_TTL_WORKSHEET: int = 60
+    CACHE_TTL_CLIENT: int = 3600
+    LOCAL_CACHE_MAXSIZE: int = 1024
+    HTTP_CACHE_MAX_AGE: int = 30
+    PREFETCH_NEXT_PAGE: bool = False
     
     def validate_config(self) -> None:
         """Validate required configuration settings."""
@@ -45,5 +72,16 @@ class Settings:
             )
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Get the application settings, loading them on first use.
+    
+    Returns:
+        Cached Settings instance
+    """
+    return Settings()
+
+
+# Global settings instance for module-level configuration
+settings = get_settings()
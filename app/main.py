@@ -6,12 +6,19 @@ routes, and configuration.
 """
 
 import logging
+import logging.handlers
+import queue
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api import health_router, sheets_router
 from app.config import settings
+from app.services import sheets_service
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +28,38 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Manage resources that live for the whole application lifetime.
+    
+    While the application runs, log records are handed to a background
+    thread so emitting never blocks the event loop; the listener writes
+    them with the handlers configured above. The queue is only installed
+    together with its listener, so records logged outside the lifespan
+    are written directly.
+    
+    Args:
+        app: FastAPI application instance
+    """
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    log_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    log_listener.start()
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    try:
+        sheets_service.startup()
+        yield
+        await sheets_service.shutdown()
+    finally:
+        # Write directly again, then flush the records still queued
+        root_logger.handlers = handlers
+        log_listener.stop()
+
+
 def create_app() -> FastAPI:
     """
     Create and configure the FastAPI application.
@@ -42,7 +81,9 @@ def create_app() -> FastAPI:
         version=settings.API_VERSION,
         docs_url="/docs",
         redoc_url="/redoc",
-        openapi_url="/openapi.json"
+        openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
     )
     
     # Add CORS middleware
@@ -54,6 +95,15 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Compress large responses (row listings) for clients accepting gzip;
+    # level 6 keeps most of the size reduction at a fraction of the CPU cost
+    if settings.GZIP_MINIMUM_SIZE > 0:
+        app.add_middleware(
+            GZipMiddleware,
+            minimum_size=settings.GZIP_MINIMUM_SIZE,
+            compresslevel=6
+        )
+    
     # Include routers
     app.include_router(health_router, tags=["Health"])
     app.include_router(sheets_router, tags=["Sheets"])
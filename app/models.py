@@ -5,7 +5,7 @@ This module contains all data models used for request/response validation,
 serialization, and documentation in the API.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, validator
 
@@ -25,13 +25,6 @@ class SheetRow(BaseModel):
         }
     """
     model_config = {"extra": "allow"}
-    
-    def __init__(self, **data):
-        super().__init__(**data)
-        
-    def model_dump(self, **kwargs) -> Dict[str, Any]:
-        """Export model data as dictionary."""
-        return super().model_dump(**kwargs)
 
 
 class SheetInfo(BaseModel):
@@ -98,6 +91,40 @@ class SheetGetRowsOptions(BaseModel):
         return v
 
 
+class BatchGetSheetOptions(BaseModel):
+    """
+    Rows to read from one sheet within a batch request.
+    
+    Identifies a sheet and the page of rows to return from it.
+    """
+    sheet_id: str = Field(..., description="Sheet ID, index, or title")
+    offset: int = Field(
+        0,
+        ge=0,
+        description="Number of rows to skip from the beginning"
+    )
+    limit: int = Field(
+        100,
+        ge=1,
+        le=1000,
+        description="Maximum number of rows to return"
+    )
+
+
+class BatchGetRequest(BaseModel):
+    """
+    Request body for reading several sheets at once.
+    
+    All sheets must belong to the same spreadsheet document and are
+    fetched with a single Google Sheets API call.
+    """
+    sheets: List[BatchGetSheetOptions] = Field(
+        ...,
+        min_length=1,
+        description="Sheets and pages to read"
+    )
+
+
 class ErrorResponse(BaseModel):
     """
     Standard error response format.
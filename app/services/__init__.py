@@ -5,9 +5,25 @@ This package contains all service modules that handle business logic
 and external API interactions.
 """
 
+from .cache import (
+    advance_document_generation,
+    cache_get_or_set,
+    document_generation,
+    invalidate_document_cache,
+    make_cache_key,
+    single_flight,
+    token_fingerprint,
+)
 from .sheets import GoogleSheetsService, sheets_service
 
 __all__ = [
     "GoogleSheetsService",
+    "advance_document_generation",
+    "cache_get_or_set",
+    "document_generation",
+    "invalidate_document_cache",
+    "make_cache_key",
     "sheets_service",
+    "single_flight",
+    "token_fingerprint",
 ]
@@ -0,0 +1,255 @@
+"""
+Response cache service module.
+
+This module provides a cache for read endpoints so repeated requests for
+the same sheet data are served without calling the Google Sheets API.
+Responses are cached in Redis when REDIS_URL is configured, and shared
+by every worker. Otherwise each worker keeps its own in-process cache
+(up to LOCAL_CACHE_MAXSIZE entries, 0 disables caching). Invalidations
+only reach the worker that handled the write, so with several workers
+the others can serve stale responses until their entries expire (up to
+the cache TTL). The in-process cache is never used in front of Redis
+for the same reason.
+
+It also provides in-process request coalescing (single-flight) so
+concurrent identical reads share one upstream call.
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+import orjson
+from cachetools import TLRUCache
+from redis.asyncio import Redis
+
+from app.config import settings
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+# Prefix shared by all keys written by this module
+CACHE_KEY_PREFIX = "sheetful"
+
+# Global Redis client (None when caching is disabled)
+redis_client: Optional[Redis] = (
+    Redis.from_url(settings.REDIS_URL) if settings.REDIS_URL else None
+)
+
+# In-process cache of (ttl, value) entries, used only when Redis is not
+# configured (None when disabled)
+local_cache: Optional[TLRUCache] = (
+    TLRUCache(
+        maxsize=settings.LOCAL_CACHE_MAXSIZE,
+        ttu=lambda _key, entry, now: now + entry[0]
+    )
+    if settings.LOCAL_CACHE_MAXSIZE > 0 else None
+)
+
+# Loads currently in progress, keyed by cache key
+_inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+# Number of times each document was invalidated. Loads remember the
+# generation they started in, so data read before a write is neither
+# shared with nor cached for requests made after it.
+_generations: Counter = Counter()
+
+
+def document_generation(document_id: str) -> int:
+    """
+    Get the current invalidation generation of a document.
+
+    Args:
+        document_id: Google Spreadsheet document ID
+
+    Returns:
+        Number of times the document was invalidated
+    """
+    return _generations[document_id]
+
+
+def advance_document_generation(document_id: str) -> None:
+    """
+    Start a new invalidation generation for a document.
+
+    Loads already in progress are no longer joined by new callers, and
+    their results are no longer cached.
+
+    Args:
+        document_id: Google Spreadsheet document ID
+    """
+    _generations[document_id] += 1
+
+
+def token_fingerprint(access_token: Optional[str]) -> str:
+    """
+    Identify the credentials of a request without storing the token.
+    
+    Args:
+        access_token: OAuth2 access token (optional)
+        
+    Returns:
+        Short hash of the token, or "apikey" when no token is given
+    """
+    if access_token:
+        return hashlib.sha256(access_token.encode()).hexdigest()[:16]
+    return "apikey"
+
+
+def make_cache_key(
+    document_id: str,
+    sheet_id: str,
+    access_token: Optional[str],
+    *parts: Any
+) -> str:
+    """
+    Build a cache key for a sheet read.
+
+    The access token is hashed into the key so cached data is only ever
+    served back to callers using the same credentials.
+
+    Args:
+        document_id: Google Spreadsheet document ID
+        sheet_id: Sheet identifier (ID, index, or title)
+        access_token: OAuth2 access token (optional)
+        *parts: Additional key components (endpoint name, pagination, ...)
+
+    Returns:
+        Cache key string
+    """
+    principal = token_fingerprint(access_token)
+    return ":".join(
+        [CACHE_KEY_PREFIX, document_id, sheet_id, principal, *map(str, parts)]
+    )
+
+
+async def cache_get_or_set(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: int,
+    document_id: Optional[str] = None
+) -> Any:
+    """
+    Return the cached value for a key, loading and storing it on a miss.
+
+    Values are cached in Redis, or in the in-process cache when Redis is
+    not configured. Cache errors are logged and never fail the request;
+    the loader is called directly when Redis is unavailable. A value
+    loaded while its document was invalidated is returned but not
+    stored, since it may predate the write.
+
+    Args:
+        key: Cache key
+        loader: Coroutine function producing the value on a cache miss
+        ttl: Time to live of the cached value in seconds
+        document_id: Document the value is read from (optional)
+
+    Returns:
+        The cached or freshly loaded value
+    """
+    generation = document_generation(document_id) if document_id else 0
+
+    def is_current() -> bool:
+        return not document_id or document_generation(document_id) == generation
+
+    if redis_client is None:
+        if local_cache is not None:
+            entry = local_cache.get(key)
+            if entry is not None:
+                logger.debug(f"Local cache hit: {key}")
+                return entry[1]
+
+        value = await loader()
+        if local_cache is not None and is_current():
+            local_cache[key] = (ttl, value)
+        return value
+
+    try:
+        cached = await redis_client.get(key)
+        if cached is not None:
+            logger.debug(f"Cache hit: {key}")
+            return orjson.loads(cached)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {str(e)}")
+
+    value = await loader()
+    if not is_current():
+        return value
+
+    try:
+        await redis_client.setex(key, ttl, orjson.dumps(value))
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {str(e)}")
+
+    return value
+
+
+async def single_flight(
+    key: Hashable,
+    loader: Callable[[], Awaitable[Any]],
+    document_id: Optional[str] = None
+) -> Any:
+    """
+    Run a loader once for all concurrent callers sharing the same key.
+
+    The first caller starts the load; callers arriving while it is still
+    running await the same result instead of issuing their own request.
+    The load is shielded so a cancelled caller does not cancel it for the
+    others. When document_id is given, a load started before the document
+    was last invalidated is not joined, so reads made after a write never
+    get data read before it.
+
+    Args:
+        key: Coalescing key (the cache key, or a tuple identifying a
+            resolved worksheet read)
+        loader: Coroutine function performing the load
+        document_id: Document the load reads from (optional)
+
+    Returns:
+        The loaded value
+    """
+    if document_id:
+        key = (key, document_generation(document_id))
+    pending = _inflight.get(key)
+    if pending is not None:
+        logger.debug(f"Joining in-flight load: {key}")
+        return await asyncio.shield(pending)
+
+    task = asyncio.ensure_future(loader())
+    _inflight[key] = task
+    task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
+async def invalidate_document_cache(document_id: str) -> None:
+    """
+    Remove every cached entry belonging to a document.
+
+    The whole document is invalidated rather than a single sheet because
+    the same sheet may be cached under its ID, index, and title. Loads
+    still in progress are left to finish, but are no longer joined and
+    their results are not cached.
+
+    Args:
+        document_id: Google Spreadsheet document ID
+    """
+    advance_document_generation(document_id)
+
+    if local_cache is not None:
+        prefix = f"{CACHE_KEY_PREFIX}:{document_id}:"
+        for key in [key for key in local_cache if key.startswith(prefix)]:
+            local_cache.pop(key, None)
+
+    if redis_client is None:
+        return
+
+    try:
+        pattern = f"{CACHE_KEY_PREFIX}:{document_id}:*"
+        keys = [key async for key in redis_client.scan_iter(match=pattern)]
+        if keys:
+            await redis_client.delete(*keys)
+            logger.debug(f"Invalidated {len(keys)} cache entries for {document_id}")
+    except Exception as e:
+        logger.warning(f"Cache invalidation failed for {document_id}: {str(e)}")
@@ -0,0 +1,81 @@
+"""
+Rate limiting service module.
+
+This module provides an asyncio token bucket used to pace calls to the
+Google Sheets API, so bursts of traffic queue up instead of failing
+with 429 quota errors.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from app.config import settings
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+
+class AsyncTokenBucket:
+    """
+    Asyncio token bucket limiting the rate of an operation.
+
+    Tokens are refilled continuously at `rate` per second up to
+    `capacity`. Each acquisition consumes one token; when none are left
+    the caller waits (without blocking the event loop) until one is
+    refilled. Waiters are served in arrival order.
+
+    A rate of zero or less disables limiting.
+
+    Example:
+        bucket = AsyncTokenBucket(rate=5.0)
+        async with bucket:
+            await call_api()
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens stored (defaults to one second of rate)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        if self.rate <= 0:
+            return
+
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                logger.debug(f"Rate limit reached, waiting {delay:.3f}s")
+                await asyncio.sleep(delay)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+# Global buckets for Google Sheets API reads and writes
+read_bucket = AsyncTokenBucket(settings.SHEETS_READ_QPS)
+write_bucket = AsyncTokenBucket(settings.SHEETS_WRITE_QPS)
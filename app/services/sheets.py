@@ -5,20 +5,88 @@ This module provides a service class for interacting with Google Sheets API,
 handling authentication, sheet operations, and error management.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import math
+import time
+import weakref
+from collections import Counter
+from functools import lru_cache, partial
+from itertools import islice, zip_longest
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import gspread
+from anyio import CapacityLimiter, to_thread
+from cachetools import TTLCache
 from fastapi import HTTPException
 from google.auth.exceptions import RefreshError
 from google.oauth2.credentials import Credentials
+from gspread.utils import (
+    ValueInputOption,
+    absolute_range_name,
+    numericise,
+    numericise_all,
+    rowcol_to_a1,
+)
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from app.config import settings
 from app.models import SheetGetRowsOptions
+from app.services.cache import (
+    advance_document_generation,
+    document_generation,
+    single_flight,
+    token_fingerprint,
+)
+from app.services.rate_limit import AsyncTokenBucket, read_bucket, write_bucket
+from app.services.sheets_api import AsyncSheetsClient
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Read cells as displayed in the sheet, as get_all_records() does; data
+# cells are then numericised with _numericise_rows
+VALUE_RENDER_PARAMS = {
+    "valueRenderOption": "FORMATTED_VALUE",
+}
+
+# Maximum number of rows sent to the Sheets API in a single write call
+WRITE_BATCH_SIZE = 4096
+
+# Grid size (rows x columns) from which a query reads only the filtered
+# columns before fetching matching rows, instead of the whole sheet
+COLUMN_FILTER_MIN_CELLS = 100_000
+
+# Maximum number of row ranges requested at once for the matching rows of a
+# column filter; sparser matches fetch the span between the first and last
+MAX_ROW_RANGES = 100
+
+# Spreadsheet metadata fetched when opening a document: its properties and
+# the properties of every sheet, without grid data
+DOCUMENT_FIELDS = "spreadsheetId,properties,sheets.properties"
+
+# Seconds during which the grid size of a worksheet is trusted after it was
+# read; older sizes are read again before answering past the last row
+GRID_FRESH_SECONDS = 2
+
+# Maximum number of prefetched pages kept in memory
+PREFETCH_CACHE_SIZE = 8
+
+# Maximum number of whole worksheets (headers and rows) kept in memory
+SHEET_VALUES_CACHE_SIZE = 32
+
+# Maximum number of query results over in-memory worksheets kept in memory
+MATCHED_ROWS_CACHE_SIZE = 256
+
+# Sheets API status codes worth retrying (quota and transient errors)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
 
 class GoogleSheetsAuthError(Exception):
     """Custom exception for authentication errors."""
@@ -30,6 +98,256 @@ class GoogleSheetsNotFoundError(Exception):
     pass
 
 
+class PrefetchedSpreadsheet(gspread.Spreadsheet):
+    """
+    Spreadsheet built from metadata fetched when it was opened.
+    
+    gspread looks worksheets up (by ID, index, or title) by fetching the
+    spreadsheet metadata again on every call. Here those lookups are
+    answered from the metadata fetched once, so opening a document and
+    resolving one of its sheets costs a single API call. Worksheets are
+    built once and indexed by ID and title, so lookups are dictionary
+    hits instead of scans.
+    """
+    
+    def __init__(self, http_client: Any, metadata: Dict[str, Any]):
+        """
+        Initialize the spreadsheet from already fetched metadata.
+        
+        gspread's constructor is not called since it would fetch the
+        metadata again.
+        
+        Args:
+            http_client: gspread HTTP client of the opening client
+            metadata: spreadsheets.get response with DOCUMENT_FIELDS
+        """
+        self.client = http_client
+        self._metadata = metadata
+        self._properties = {"id": metadata["spreadsheetId"], **metadata["properties"]}
+        self._worksheets = [
+            gspread.Worksheet(self, sheet["properties"], self.id, http_client)
+            for sheet in metadata.get("sheets", [])
+        ]
+        self._worksheets_by_id = {worksheet.id: worksheet for worksheet in self._worksheets}
+        self._worksheets_by_title: Dict[str, gspread.Worksheet] = {}
+        for worksheet in self._worksheets:
+            # The first sheet wins on duplicate titles, as in gspread
+            self._worksheets_by_title.setdefault(worksheet.title, worksheet)
+        # When the grid size of each worksheet was last read
+        self.grid_fetched_at = dict.fromkeys(self._worksheets_by_id, time.monotonic())
+    
+    def fetch_sheet_metadata(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Return the fetched metadata, or call the API for custom params."""
+        if params is None:
+            return self._metadata
+        return super().fetch_sheet_metadata(params)
+    
+    def worksheets(self, exclude_hidden: bool = False) -> List[gspread.Worksheet]:
+        """Return the worksheets of the document, in sheet order."""
+        if exclude_hidden:
+            return [worksheet for worksheet in self._worksheets if not worksheet.isSheetHidden]
+        return list(self._worksheets)
+    
+    def get_worksheet_by_id(self, id: Union[str, int]) -> gspread.Worksheet:
+        """Return the worksheet with the given sheet ID."""
+        worksheet = self._worksheets_by_id.get(int(id))
+        if worksheet is None:
+            raise gspread.exceptions.WorksheetNotFound(f"id {id} not found")
+        return worksheet
+    
+    def get_worksheet(self, index: int) -> gspread.Worksheet:
+        """Return the worksheet at the given position."""
+        try:
+            return self._worksheets[index]
+        except IndexError:
+            raise gspread.exceptions.WorksheetNotFound(f"index {index} not found")
+    
+    def worksheet(self, title: str) -> gspread.Worksheet:
+        """Return the first worksheet with the given title."""
+        worksheet = self._worksheets_by_title.get(title)
+        if worksheet is None:
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return worksheet
+    
+    def find_worksheet(self, sheet_id: str) -> Optional[gspread.Worksheet]:
+        """
+        Find a worksheet by numeric ID, then by index, then by title.
+        
+        Args:
+            sheet_id: Sheet identifier (ID, index, or title)
+            
+        Returns:
+            The worksheet, or None if no sheet matches
+        """
+        worksheet = None
+        if sheet_id.removeprefix("-").isdecimal():
+            number = int(sheet_id)
+            worksheet = self._worksheets_by_id.get(number)
+            if worksheet is None and -len(self._worksheets) <= number < len(self._worksheets):
+                worksheet = self._worksheets[number]
+        if worksheet is None:
+            worksheet = self._worksheets_by_title.get(sheet_id)
+        return worksheet
+
+
+def _numericise_rows(rows: List[List[Any]]) -> List[List[Any]]:
+    """
+    Convert the numeric cells of formatted rows to int or float.
+    
+    Applies gspread's numericise_all() the way get_all_records() does,
+    so "30" becomes 30 while "TRUE", "50%" and "$1.50" stay strings.
+    Header rows are not numericised.
+    
+    Args:
+        rows: Formatted row values
+        
+    Returns:
+        Rows with numeric strings converted
+    """
+    return [numericise_all(row) for row in rows]
+
+
+def _is_retryable_error(error: BaseException) -> bool:
+    """Check whether a Sheets API error is a quota or transient failure."""
+    return (
+        isinstance(error, gspread.exceptions.APIError)
+        and error.response.status_code in RETRYABLE_STATUS_CODES
+    )
+
+
+def _is_quota_error(error: BaseException) -> bool:
+    """Check whether a Sheets API error is a quota (429) rejection."""
+    return (
+        isinstance(error, gspread.exceptions.APIError)
+        and error.response.status_code == 429
+    )
+
+
+@lru_cache(maxsize=256)
+def _make_row_mapper(headers: Tuple[str, ...]) -> Callable[[List[Any]], Dict[str, Any]]:
+    """
+    Compile a function converting a row of values into a dictionary.
+    
+    The header names are inlined as constants so each row is built by a
+    single dictionary display instead of a loop over the headers. Short
+    rows are padded with empty strings and cells beyond the last header
+    are keyed as Column_N. Mappers are cached per header tuple.
+    
+    Args:
+        headers: Cleaned header names
+        
+    Returns:
+        Row mapping function
+    """
+    width = len(headers)
+    fields = ", ".join(f"{header!r}: row[{i}]" for i, header in enumerate(headers))
+    source = (
+        "def map_row(row):\n"
+        f"    if len(row) < {width}:\n"
+        f"        row = list(row) + [''] * ({width} - len(row))\n"
+        f"    record = {{{fields}}}\n"
+        f"    for i in range({width}, len(row)):\n"
+        "        record[f'Column_{i + 1}'] = row[i]\n"
+        "    return record\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace["map_row"]
+
+
+def _typed_equivalents(expected: str) -> List[str]:
+    """
+    List the non-string cell values whose string form is the expected value.
+    
+    Numericised cells are str, int, or float (bool is handled for
+    completeness). Rather than
+    calling str() on every cell, the compiled filter compares the cell
+    with the expected string and with each typed value returned here
+    (as source expressions over `cell`), checking the exact type so that
+    30.0 never matches "30" and True never matches "1".
+    
+    Args:
+        expected: Expected cell value as a string
+        
+    Returns:
+        Source expressions matching the typed equivalents of expected
+    """
+    equivalents = []
+    try:
+        number = int(expected)
+        if str(number) == expected:
+            equivalents.append(f"(cell == {number!r} and cell.__class__ is int)")
+    except ValueError:
+        pass
+    try:
+        number = float(expected)
+        if not math.isfinite(number) or number == 0:
+            # No literal for non-finite values, and 0.0 == -0.0: compare
+            # the string form instead
+            equivalents.append(f"str(cell) == {expected!r}")
+        elif str(number) == expected:
+            equivalents.append(f"(cell == {number!r} and cell.__class__ is float)")
+    except ValueError:
+        pass
+    if expected in ("True", "False"):
+        equivalents.append(f"cell is {expected}")
+    return equivalents
+
+
+@lru_cache(maxsize=256)
+def _make_row_filter(
+    conditions: Tuple[Tuple[Optional[int], str], ...],
+    positions: bool = False
+) -> Callable[[Iterable[List[Any]]], Iterator[Any]]:
+    """
+    Compile query conditions into a generator filtering raw rows.
+    
+    Each condition compares one column (by index) with an expected
+    string. The whole loop is generated with the conditions inlined as
+    one boolean expression, so no function is called per row, and cells
+    are compared with their typed equivalents instead of being converted
+    with str(). A cell missing from a short row is treated as empty, and
+    a condition without a column only matches the empty string. Filters
+    are cached per condition tuple.
+    
+    Args:
+        conditions: Tuple of (column index or None, expected value) pairs
+        positions: Yield the zero-based positions of the matching rows
+            instead of the rows themselves
+        
+    Returns:
+        Function yielding the matching rows (or positions) of an iterable
+    """
+    clauses = []
+    for column, expected in conditions:
+        if column is None:
+            if expected != "":
+                return lambda rows: iter(())
+            continue
+        if expected == "":
+            clauses.append(f"(n <= {column} or row[{column}] == '')")
+            continue
+        equivalents = _typed_equivalents(expected)
+        if equivalents:
+            clauses.append(
+                f"(n > {column} and ((cell := row[{column}]) == {expected!r}"
+                f" or {' or '.join(equivalents)}))"
+            )
+        else:
+            clauses.append(f"(n > {column} and row[{column}] == {expected!r})")
+    
+    source = (
+        "def filter_rows(rows):\n"
+        f"    for {'i, row in enumerate(rows)' if positions else 'row in rows'}:\n"
+        "        n = len(row)\n"
+        f"        if {' and '.join(clauses) or 'True'}:\n"
+        f"            yield {'i' if positions else 'row'}\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace["filter_rows"]
+
+
 class GoogleSheetsService:
     """
     Service for interacting with Google Sheets API.
@@ -48,9 +366,241 @@ class GoogleSheetsService:
     
     def __init__(self):
         """Initialize the Google Sheets service."""
-        self.gc = None
+        # Shared API key client, kept for the process lifetime
+        self.gc: Optional[gspread.Client] = None
+        # Async HTTP/2 client used for value reads and writes when SHEETS_ASYNC_HTTP is set
+        self.api: Optional[AsyncSheetsClient] = None
+        # Bound on concurrent Google Sheets calls (and on the threads running
+        # blocking gspread calls), created on first use inside the event loop
+        self.limiter: Optional[CapacityLimiter] = None
+        # OAuth2 clients keyed by token fingerprint, so requests made with
+        # the same token reuse one HTTP session and connection pool
+        self.oauth_clients: TTLCache = TTLCache(
+            maxsize=256, ttl=settings.CACHE_TTL_CLIENT
+        )
+        # Opened documents keyed by (document_id, token fingerprint)
+        self.document_cache: TTLCache = TTLCache(
+            maxsize=256, ttl=settings.CACHE_TTL_WORKSHEET
+        )
+        # Resolved (document, worksheet) pairs keyed by
+        # (document_id, sheet_id, token fingerprint)
+        self.worksheet_cache: TTLCache = TTLCache(
+            maxsize=1024, ttl=settings.CACHE_TTL_WORKSHEET
+        )
+        # Cleaned header rows keyed by _worksheet_key
+        self.header_cache: TTLCache = TTLCache(
+            maxsize=1024, ttl=settings.CACHE_TTL_WORKSHEET
+        )
+        # Header name to column index mappings keyed by _worksheet_key, as
+        # (header row indexed, mapping)
+        self.header_indexes: TTLCache = TTLCache(
+            maxsize=1024, ttl=settings.CACHE_TTL_WORKSHEET
+        )
+        # Whole worksheets read for filtering, keyed by _worksheet_key, so
+        # later pages, queries and rows of the same sheet are served locally
+        self.sheet_values: TTLCache = TTLCache(
+            maxsize=SHEET_VALUES_CACHE_SIZE, ttl=settings.CACHE_TTL_ROWS
+        )
+        # Rows of an in-memory worksheet matching a query, keyed by
+        # (*_worksheet_key, query), as (rows filtered, matching rows)
+        self.matched_rows: TTLCache = TTLCache(
+            maxsize=MATCHED_ROWS_CACHE_SIZE, ttl=settings.CACHE_TTL_ROWS
+        )
+        # Pages loading (or loaded) ahead of the request asking for them
+        self.prefetched_pages: TTLCache = TTLCache(
+            maxsize=PREFETCH_CACHE_SIZE, ttl=settings.CACHE_TTL_ROWS
+        )
+        # Google Sheets API requests sent, and retried, per operation name
+        self.api_calls: Counter = Counter()
+        self.api_retries: Counter = Counter()
         logger.info("GoogleSheetsService initialized")
     
+    def startup(self) -> None:
+        """
+        Create long-lived resources shared across requests.
+        
+        Opens the API key client up front so its HTTP connection pool is
+        reused by every request instead of being rebuilt per call, and the
+        async HTTP client when enabled.
+        """
+        if settings.GOOGLE_API_KEY and self.gc is None:
+            self.gc = self._configure_session(gspread.api_key(settings.GOOGLE_API_KEY))
+            logger.info("Shared Google Sheets API key client created")
+        if settings.SHEETS_ASYNC_HTTP and self.api is None:
+            self.api = AsyncSheetsClient()
+            logger.info("Async Google Sheets HTTP client created")
+    
+    async def shutdown(self) -> None:
+        """Close long-lived resources created by startup()."""
+        if self.api is not None:
+            await self.api.aclose()
+            self.api = None
+            logger.info("Async Google Sheets HTTP client closed")
+        if self.gc is not None:
+            self.gc.http_client.session.close()
+            self.gc = None
+            logger.info("Shared Google Sheets API key client closed")
+        for client in self.oauth_clients.values():
+            client.http_client.session.close()
+        self.oauth_clients.clear()
+    
+    @staticmethod
+    def _configure_session(client: gspread.Client) -> gspread.Client:
+        """
+        Size the client's HTTP connection pool for concurrent requests.
+        
+        Args:
+            client: gspread client to configure
+            
+        Returns:
+            The same client
+        """
+        adapter = HTTPAdapter(pool_maxsize=settings.SHEETS_POOL_MAXSIZE)
+        client.http_client.session.mount("https://", adapter)
+        return client
+    
+    def invalidate_worksheets(self, document_id: str) -> None:
+        """
+        Drop cached documents, worksheets, sheet values, query results and
+        prefetched pages of a document.
+        
+        Called after writes, since appending rows can grow the grid and
+        make the cached row count stale, and cached or prefetched rows
+        outdated. Reads still in progress are no longer joined, and do not
+        store what they read, since it may predate the write.
+        
+        Args:
+            document_id: Google Spreadsheet document ID
+        """
+        advance_document_generation(document_id)
+        for key in [key for key in self.document_cache if key[0] == document_id]:
+            self.document_cache.pop(key, None)
+        for key in [key for key in self.worksheet_cache if key[0] == document_id]:
+            self.worksheet_cache.pop(key, None)
+        for key in [key for key in self.sheet_values if key[0] == document_id]:
+            self.sheet_values.pop(key, None)
+        for key in [key for key in self.matched_rows if key[0] == document_id]:
+            self.matched_rows.pop(key, None)
+        for key in [key for key in self.prefetched_pages if key[0] == document_id]:
+            task = self.prefetched_pages.pop(key, None)
+            if task is not None:
+                task.cancel()
+    
+    async def _call(
+        self,
+        bucket: AsyncTokenBucket,
+        func: Callable[..., Any],
+        *args: Any,
+        retry_if: Callable[[BaseException], bool] = _is_retryable_error,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Call a Google Sheets API operation with rate limiting and retries.
+        
+        Quota (429) and transient server (5xx) errors are retried with
+        capped exponential backoff and full jitter, unless retry_if narrows
+        them down for operations that are unsafe to repeat. Blocking gspread calls
+        run in worker threads so they never stall the event loop; at most
+        SHEETS_THREADPOOL_SIZE calls (of either transport) run at once,
+        separately from the threadpool FastAPI uses for its own work. Every
+        attempt is counted in api_calls (and retries in api_retries) under
+        the name of func, to show which operations use the quota.
+        
+        Args:
+            bucket: Token bucket pacing the call
+            func: gspread method (or coroutine function) performing the API call
+            *args: Positional arguments for func
+            retry_if: Predicate selecting the errors worth retrying
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            The result of func
+            
+        Raises:
+            HTTPException: If the API is still rate limited or unavailable
+                after the last attempt (with a Retry-After header), or
+                rejects the credentials (401)
+        """
+        if self.limiter is None:
+            self.limiter = CapacityLimiter(settings.SHEETS_THREADPOOL_SIZE)
+        
+        try:
+            async for attempt in AsyncRetrying(
+                retry=retry_if_exception(retry_if),
+                stop=stop_after_attempt(settings.SHEETS_RETRY_ATTEMPTS),
+                wait=wait_random_exponential(
+                    multiplier=0.5, min=0.5, max=settings.SHEETS_RETRY_MAX_WAIT
+                ),
+                reraise=True,
+            ):
+                with attempt:
+                    self.api_calls[func.__name__] += 1
+                    if attempt.retry_state.attempt_number > 1:
+                        self.api_retries[func.__name__] += 1
+                    async with bucket:
+                        if asyncio.iscoroutinefunction(func):
+                            async with self.limiter:
+                                return await func(*args, **kwargs)
+                        return await to_thread.run_sync(
+                            partial(func, *args, **kwargs), limiter=self.limiter
+                        )
+        except (RefreshError, gspread.exceptions.APIError) as e:
+            if isinstance(e, RefreshError) or e.response.status_code == 401:
+                logger.warning(f"Google Sheets API rejected the credentials: {str(e)}")
+                raise HTTPException(
+                    status_code=401,
+                    detail="Authentication failed. The access token is invalid or expired."
+                )
+            if not retry_if(e):
+                raise
+            status_code = e.response.status_code
+            logger.error(f"Google Sheets API error {status_code} after retries: {str(e)}")
+            retry_after = e.response.headers.get(
+                "Retry-After", str(int(settings.SHEETS_RETRY_MAX_WAIT))
+            )
+            raise HTTPException(
+                status_code=429 if status_code == 429 else 503,
+                detail="Google Sheets API is rate limited or unavailable, please retry later",
+                headers={"Retry-After": retry_after}
+            )
+    
+    async def _read(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a Google Sheets read operation under the read rate limit.
+        
+        Args:
+            func: gspread method performing the API call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            The result of func
+        """
+        return await self._call(read_bucket, func, *args, **kwargs)
+    
+    async def _write(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a Google Sheets write operation under the write rate limit.
+        
+        Args:
+            func: gspread method performing the API call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            The result of func
+        """
+        return await self._call(write_bucket, func, *args, **kwargs)
+    
+    def get_api_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get the number of Google Sheets API requests made since startup.
+        
+        Returns:
+            Requests sent and retried, each keyed by operation name
+        """
+        return {"calls": dict(self.api_calls), "retries": dict(self.api_retries)}
+    
     def _get_client(self, access_token: Optional[str] = None) -> gspread.Client:
         """
         Get authenticated Google Sheets client.
@@ -68,11 +618,23 @@ class GoogleSheetsService:
         try:
             if access_token:
                 logger.debug("Using OAuth2 access token for authentication")
-                credentials = Credentials(token=access_token)
-                return gspread.authorize(credentials)
+                key = token_fingerprint(access_token)
+                client = self.oauth_clients.get(key)
+                if client is None:
+                    credentials = Credentials(token=access_token)
+                    client = self._configure_session(gspread.authorize(credentials))
+                    # Close the pooled connections once nothing uses the
+                    # HTTP client any more: the client was evicted (or
+                    # expired), no cached document still holds it, and its
+                    # last request finished
+                    weakref.finalize(client.http_client, client.http_client.session.close)
+                    self.oauth_clients[key] = client
+                return client
             elif settings.GOOGLE_API_KEY:
                 logger.debug("Using API key for authentication")
-                return gspread.api_key(settings.GOOGLE_API_KEY)
+                if self.gc is None:
+                    self.startup()
+                return self.gc
             else:
                 raise GoogleSheetsAuthError("No valid authentication method available")
                 
@@ -87,6 +649,13 @@ class GoogleSheetsService:
         """
         Get Google Spreadsheet document.
         
+        The document and the properties of all its sheets are fetched with
+        one spreadsheets.get call, so later sheet lookups are local.
+        Opened documents are cached per credentials for
+        CACHE_TTL_WORKSHEET seconds (or until the next write), and
+        concurrent opens of the same document share one call. The client
+        of an access token the API rejects is evicted.
+        
         Args:
             document_id: Google Spreadsheet document ID
             access_token: OAuth2 access token (optional)
@@ -97,13 +666,35 @@ class GoogleSheetsService:
         Raises:
             HTTPException: If document cannot be accessed
         """
+        key = (document_id, token_fingerprint(access_token))
+        cached = self.document_cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
             logger.info(f"Accessing document: {document_id}")
             client = self._get_client(access_token)
-            document = client.open_by_key(document_id)
+            generation = document_generation(document_id)
+            metadata = await single_flight(
+                ("document", *key),
+                lambda: self._read(
+                    client.http_client.fetch_sheet_metadata,
+                    document_id,
+                    params={"fields": DOCUMENT_FIELDS}
+                ),
+                document_id=document_id
+            )
+            document = PrefetchedSpreadsheet(client.http_client, metadata)
+            if document_generation(document_id) == generation:
+                self.document_cache[key] = document
             logger.info(f"Successfully opened document: {document.title}")
             return document
             
+        except HTTPException as e:
+            if e.status_code == 401 and access_token:
+                # The token can no longer be used, drop its cached client
+                self.oauth_clients.pop(key[1], None)
+            raise
         except Exception as e:
             logger.error(f"Error accessing document {document_id}: {str(e)}")
             raise HTTPException(
@@ -120,6 +711,9 @@ class GoogleSheetsService:
         2. By index
         3. By title/name
         
+        The identifier is resolved in one pass over the worksheets indexed
+        when the document was opened, without calling the API.
+        
         Args:
             document: Google Spreadsheet document
             sheet_id: Sheet identifier (ID, index, or title)
@@ -133,29 +727,15 @@ class GoogleSheetsService:
         try:
             logger.debug(f"Looking for sheet: {sheet_id}")
             
-            # Try to get sheet by numeric ID first
-            try:
-                sheet_id_int = int(sheet_id)
-                worksheet = document.get_worksheet_by_id(sheet_id_int)
-                logger.debug(f"Found sheet by ID: {worksheet.title}")
-                return worksheet
-            except (ValueError, gspread.exceptions.WorksheetNotFound):
-                pass
-            
-            # Try to get sheet by index
-            try:
-                sheet_index = int(sheet_id)
-                worksheet = document.get_worksheet(sheet_index)
-                logger.debug(f"Found sheet by index: {worksheet.title}")
-                return worksheet
-            except (ValueError, IndexError):
-                pass
-            
-            # Try to get sheet by title
-            worksheet = document.worksheet(sheet_id)
-            logger.debug(f"Found sheet by title: {worksheet.title}")
+            worksheet = document.find_worksheet(sheet_id)
+            if worksheet is None:
+                raise gspread.exceptions.WorksheetNotFound(sheet_id)
+            
+            logger.debug(f"Found sheet: {worksheet.title}")
             return worksheet
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Sheet not found '{sheet_id}': {str(e)}")
             raise HTTPException(
@@ -163,95 +743,592 @@ class GoogleSheetsService:
                 detail=f"Sheet '{sheet_id}' not found: {str(e)}"
             )
     
-    def _get_safe_headers(self, worksheet) -> List[str]:
+    async def _get_safe_headers(self, worksheet) -> List[str]:
         """
         Get headers from worksheet, handling duplicates and empty values.
         
+        Header rows are cached for CACHE_TTL_WORKSHEET seconds (and
+        stored by every read that fetches row 1 anyway), so writes and
+        sheet info usually skip the read. The API never writes the header
+        row itself, so writes do not invalidate them. Concurrent misses for
+        the same worksheet share one read.
+        
         Args:
             worksheet: Google Sheets worksheet object
             
         Returns:
             List of cleaned header names
         """
+        key = self._worksheet_key(worksheet)
+        cached = self.header_cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
-            headers = worksheet.row_values(1) if worksheet.row_count > 0 else []
-            cleaned_headers = []
-            seen_headers = set()
-            
-            for i, header in enumerate(headers):
-                # Clean the header
-                clean_header = str(header).strip()
-                
-                # Handle empty headers
-                if not clean_header:
-                    clean_header = f"Column_{i + 1}"
-                
-                # Handle duplicates
-                original_header = clean_header
-                counter = 1
-                while clean_header in seen_headers:
-                    clean_header = f"{original_header}_{counter}"
-                    counter += 1
-                
-                cleaned_headers.append(clean_header)
-                seen_headers.add(clean_header)
-            
-            return cleaned_headers
+            return await single_flight(
+                (*key, "headers"),
+                lambda: self._load_headers(worksheet),
+                document_id=worksheet.spreadsheet_id
+            )
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error getting headers: {str(e)}")
             return []
     
-    def _get_all_records_safe(self, worksheet) -> List[Dict[str, Any]]:
+    async def _load_headers(self, worksheet) -> List[str]:
         """
-        Safely get all records from worksheet, handling header issues.
+        Read and store the header row of a worksheet.
+        
+        Row 1 is read like any other range, through the async HTTP client
+        when it is enabled.
         
         Args:
             worksheet: Google Sheets worksheet object
             
         Returns:
-            List of row dictionaries with cleaned headers
+            List of cleaned header names
         """
-        try:
-            # First try the normal method
-            return worksheet.get_all_records()
-        except Exception as e:
-            logger.warning(f"Standard get_all_records failed: {str(e)}")
-            logger.info("Attempting to retrieve data with custom header handling")
+        generation = document_generation(worksheet.spreadsheet_id)
+        headers: List[Any] = []
+        if worksheet.row_count > 0:
+            header_values, = await self._get_ranges(worksheet, ["1:1"])
+            headers = header_values[0] if header_values else []
+        return self._store_headers(worksheet, self._clean_headers(headers), generation)
+    
+    def _store_headers(self, worksheet, headers: List[str], generation: int) -> List[str]:
+        """
+        Remember the cleaned header row of a worksheet.
+        
+        Empty header rows are not stored, so a sheet that is still being
+        set up is read again next time. An unchanged header row keeps the
+        list already stored, so its header index stays valid. Nothing is
+        stored when the document was invalidated since the read started.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            headers: Cleaned header names
+            generation: Document generation when the read started
             
-            try:
-                # Get cleaned headers
-                headers = self._get_safe_headers(worksheet)
-                
-                if not headers:
-                    logger.warning("No headers found, returning empty list")
-                    return []
-                
-                # Get all values and skip the header row
-                all_values = worksheet.get_all_values()
-                if len(all_values) <= 1:
-                    logger.info("No data rows found")
-                    return []
-                
-                # Convert to list of dictionaries using cleaned headers
-                records = []
-                for row_values in all_values[1:]:  # Skip header row
-                    record = {}
-                    for i, value in enumerate(row_values):
-                        if i < len(headers):
-                            record[headers[i]] = value
-                        else:
-                            # Handle rows with more columns than headers
-                            record[f"Column_{i + 1}"] = value
-                    records.append(record)
-                
-                logger.info(f"Successfully retrieved {len(records)} records with custom header handling")
-                return records
-                
-            except Exception as fallback_error:
-                logger.error(f"Fallback method also failed: {str(fallback_error)}")
-                raise fallback_error
-
+        Returns:
+            The stored headers
+        """
+        if headers and document_generation(worksheet.spreadsheet_id) == generation:
+            key = self._worksheet_key(worksheet)
+            cached = self.header_cache.get(key)
+            if cached == headers:
+                headers = cached
+            self.header_cache[key] = headers
+        return headers
+    
+    @staticmethod
+    def _clean_headers(headers: Sequence[Any]) -> List[str]:
+        """
+        Clean raw header values, naming empty and duplicate columns.
+        
+        Args:
+            headers: Raw values from the header row
+            
+        Returns:
+            List of cleaned header names
+        """
+        cleaned_headers = []
+        seen_headers = set()
+        
+        for i, header in enumerate(headers):
+            # Clean the header
+            clean_header = str(header).strip()
+            
+            # Handle empty headers
+            if not clean_header:
+                clean_header = f"Column_{i + 1}"
+            
+            # Handle duplicates
+            original_header = clean_header
+            counter = 1
+            while clean_header in seen_headers:
+                clean_header = f"{original_header}_{counter}"
+                counter += 1
+            
+            cleaned_headers.append(clean_header)
+            seen_headers.add(clean_header)
+        
+        return cleaned_headers
+    
+    @staticmethod
+    def _rows_to_records(
+        headers: List[str],
+        rows: List[List[Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert raw row values into dictionaries keyed by header.
+        
+        Missing trailing cells (which the API omits) become empty strings
+        and cells beyond the last header are keyed as Column_N.
+        
+        Args:
+            headers: Cleaned header names
+            rows: Row values as returned by the Sheets API
+            
+        Returns:
+            List of row dictionaries
+        """
+        map_row = _make_row_mapper(tuple(headers))
+        return [map_row(row) for row in rows]
+    
+    async def _batch_get_values(
+        self,
+        http_client: Any,
+        spreadsheet_id: str,
+        ranges: List[str]
+    ) -> List[List[List[Any]]]:
+        """
+        Read several ranges with a single values.batchGet call.
+        
+        Goes through the async HTTP client when it is enabled, and
+        through the gspread client otherwise. Values are rendered with
+        VALUE_RENDER_PARAMS.
+        
+        Args:
+            http_client: gspread HTTP client of the document
+            spreadsheet_id: Google Spreadsheet document ID
+            ranges: Ranges in A1 notation, including the sheet title
+            
+        Returns:
+            Values of each range, in the same order as ranges
+        """
+        if self.api is not None:
+            response = await self._read(
+                self.api.values_batch_get,
+                spreadsheet_id,
+                ranges,
+                http_client.auth,
+                params=VALUE_RENDER_PARAMS
+            )
+        else:
+            response = await self._read(
+                http_client.values_batch_get,
+                spreadsheet_id,
+                ranges,
+                params=dict(VALUE_RENDER_PARAMS)
+            )
+        return [value_range.get("values", []) for value_range in response.get("valueRanges", [])]
+    
+    async def _get_ranges(
+        self,
+        worksheet,
+        ranges: List[Optional[str]]
+    ) -> List[List[List[Any]]]:
+        """
+        Read several ranges of one worksheet with a single API call.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            ranges: Ranges in A1 notation relative to the worksheet
+                (None reads the whole worksheet)
+            
+        Returns:
+            Values of each range, in the same order as ranges
+        """
+        return await self._batch_get_values(
+            worksheet.client,
+            worksheet.spreadsheet_id,
+            [absolute_range_name(worksheet.title, range_name) for range_name in ranges]
+        )
+    
+    async def _get_sheet_values(self, worksheet) -> Tuple[List[str], List[List[Any]]]:
+        """
+        Fetch the header row and every data row with a single API call.
+        
+        Used where every row is needed (filtering queries), so the
+        headers come with the rows instead of costing a separate call.
+        Concurrent reads of the same worksheet are coalesced into one call,
+        and the result is kept in sheet_values for CACHE_TTL_ROWS seconds
+        (or until the next write to the document).
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            
+        Returns:
+            tuple: (cleaned headers, numericised row values without the header row)
+        """
+        key = self._worksheet_key(worksheet)
+        cached = self.sheet_values.get(key)
+        if cached is not None:
+            return cached
+        
+        return await single_flight(
+            (*key, "values"),
+            lambda: self._load_sheet_values(worksheet),
+            document_id=worksheet.spreadsheet_id
+        )
+    
+    async def _load_sheet_values(self, worksheet) -> Tuple[List[str], List[List[Any]]]:
+        """
+        Read a whole worksheet and keep it in sheet_values.
+        
+        The header row is split off here, once per read, so callers
+        sharing a coalesced read also share the same row list (and the
+        query results matched_rows holds for it).
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            
+        Returns:
+            tuple: (cleaned headers, numericised row values without the header row)
+        """
+        generation = document_generation(worksheet.spreadsheet_id)
+        values, = await self._get_ranges(worksheet, [None])
+        headers = self._store_headers(
+            worksheet, self._clean_headers(values[0] if values else []), generation
+        )
+        sheet = (headers, _numericise_rows(values[1:]))
+        if document_generation(worksheet.spreadsheet_id) == generation:
+            self.sheet_values[self._worksheet_key(worksheet)] = sheet
+        return sheet
+    
+    async def _get_row_values(self, worksheet, row_id: int) -> Tuple[List[str], List[Any]]:
+        """
+        Fetch the header row and a single data row with one API call.
+        
+        Rows outside the cached grid are only rejected once the grid size
+        has been read again, since the sheet may have grown since the
+        document was opened. The row is taken from
+        sheet_values when the whole sheet is in memory. Only the row
+        itself is read when the headers are cached. A blank row is only
+        missing when it is below the last data row, which is checked by
+        reading the whole sheet; blank rows inside the table are returned
+        (as an empty row) like get_all_records does, so they can be
+        filled in.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            row_id: Zero-based row index (excluding the header row)
+            
+        Returns:
+            tuple: (cleaned headers, numericised values of the row)
+            
+        Raises:
+            HTTPException: If the row is outside the grid or below the
+                last data row
+        """
+        row_number = row_id + 2  # +1 for 1-indexing, +1 for header
+        if row_number > worksheet.row_count and row_id >= 0:
+            await self._refresh_grid(worksheet)
+        if row_id < 0 or row_number > worksheet.row_count:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Row {row_id} not found"
+            )
+        
+        cached = self.sheet_values.get(self._worksheet_key(worksheet))
+        if cached is not None:
+            headers, rows = cached
+            if row_id < len(rows):
+                return headers, rows[row_id]
+            raise HTTPException(
+                status_code=404,
+                detail=f"Row {row_id} not found"
+            )
+        
+        row_range = f"{row_number}:{row_number}"
+        headers = self.header_cache.get(self._worksheet_key(worksheet))
+        if headers is not None:
+            row_values, = await self._get_ranges(worksheet, [row_range])
+        else:
+            generation = document_generation(worksheet.spreadsheet_id)
+            header_values, row_values = await self._get_ranges(worksheet, ["1:1", row_range])
+            headers = self._store_headers(
+                worksheet,
+                self._clean_headers(header_values[0] if header_values else []),
+                generation
+            )
+        
+        if not row_values:
+            # Blank, but part of the table unless below the last data row
+            headers, rows = await self._get_sheet_values(worksheet)
+            if row_id < len(rows):
+                return headers, rows[row_id]
+            raise HTTPException(
+                status_code=404,
+                detail=f"Row {row_id} not found"
+            )
+        return headers, numericise_all(row_values[0])
+    
+    @staticmethod
+    def _page_range(worksheet, options: SheetGetRowsOptions) -> Optional[str]:
+        """
+        Translate offset/limit into an A1 row range for a worksheet.
+        
+        The range is clamped to the worksheet grid, since the API rejects
+        ranges beyond the last row.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            options: Pagination options
+            
+        Returns:
+            Row range such as "2:101", or None if the page is past the end
+        """
+        first_row = options.offset + 2  # +1 for 1-indexing, +1 for header
+        last_row = min(options.offset + options.limit + 1, worksheet.row_count)
+        if first_row > last_row:
+            return None
+        return f"{first_row}:{last_row}"
+    
+    async def _fresh_page_range(self, worksheet, options: SheetGetRowsOptions) -> Optional[str]:
+        """
+        Translate offset/limit into a row range, re-reading a stale grid size.
+        
+        A page reaching past the cached grid end is only clamped once the
+        grid size has been read again, so rows added to the sheet since the
+        document was opened are listed.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            options: Pagination options
+            
+        Returns:
+            Row range such as "2:101", or None if the page is past the end
+        """
+        if options.offset + options.limit + 1 > worksheet.row_count:
+            await self._refresh_grid(worksheet)
+        return self._page_range(worksheet, options)
+    
+    async def _refresh_grid(self, worksheet) -> None:
+        """
+        Read the grid size of a worksheet again unless it is fresh.
+        
+        Worksheets come from the document cache, so their row and column
+        counts may predate rows or columns added to the sheet. Only the
+        grid properties of the worksheet are requested, and concurrent
+        refreshes of one worksheet share a single call.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+        """
+        fetched_at = worksheet._spreadsheet.grid_fetched_at
+        if time.monotonic() - fetched_at.get(worksheet.id, 0.0) < GRID_FRESH_SECONDS:
+            return
+        
+        metadata = await single_flight(
+            (*self._worksheet_key(worksheet), "grid"),
+            lambda: self._read(
+                worksheet.client.fetch_sheet_metadata,
+                worksheet.spreadsheet_id,
+                params={
+                    "ranges": absolute_range_name(worksheet.title),
+                    "fields": "sheets.properties.gridProperties",
+                }
+            ),
+            document_id=worksheet.spreadsheet_id
+        )
+        sheets = metadata.get("sheets", [])
+        if sheets and "gridProperties" in sheets[0].get("properties", {}):
+            worksheet._properties["gridProperties"] = sheets[0]["properties"]["gridProperties"]
+        fetched_at[worksheet.id] = time.monotonic()
+    
+    async def _append_values(self, worksheet, rows: List[List[Any]]) -> None:
+        """
+        Append rows below the worksheet table with one values.append call.
+        
+        Values are written as-is (RAW), as gspread's append_rows does,
+        but without its local bookkeeping, and through the async HTTP
+        client when it is enabled. Appending is not idempotent: a 5xx
+        may come back after the rows were written, so only quota (429)
+        rejections, which never write anything, are retried.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            rows: Row values in column order
+        """
+        range_name = absolute_range_name(worksheet.title)
+        params = {"valueInputOption": ValueInputOption.raw}
+        body = {"values": rows}
+        if self.api is not None:
+            await self._call(
+                write_bucket,
+                self.api.values_append,
+                worksheet.spreadsheet_id,
+                range_name,
+                worksheet.client.auth,
+                params,
+                body,
+                retry_if=_is_quota_error
+            )
+        else:
+            await self._call(
+                write_bucket,
+                worksheet.client.values_append,
+                worksheet.spreadsheet_id,
+                range_name,
+                params,
+                body,
+                retry_if=_is_quota_error
+            )
+    
+    async def _update_values(self, worksheet, data: List[Dict[str, Any]]) -> None:
+        """
+        Write several ranges of the worksheet with one values.batchUpdate call.
+        
+        Values are parsed as if typed by a user (USER_ENTERED). The call
+        goes through the async HTTP client when it is enabled.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            data: {"range", "values"} dictionaries with ranges relative
+                to the worksheet
+        """
+        body = {
+            "valueInputOption": ValueInputOption.user_entered,
+            "data": [
+                {
+                    "range": absolute_range_name(worksheet.title, item["range"]),
+                    "values": item["values"],
+                }
+                for item in data
+            ],
+        }
+        if self.api is not None:
+            await self._write(
+                self.api.values_batch_update,
+                worksheet.spreadsheet_id,
+                worksheet.client.auth,
+                body
+            )
+        else:
+            await self._write(
+                worksheet.client.values_batch_update,
+                worksheet.spreadsheet_id,
+                body
+            )
+    
+    @staticmethod
+    def _header_index(headers: List[str]) -> Dict[str, int]:
+        """
+        Map each header to its zero-based column position.
+        
+        Args:
+            headers: Cleaned header names
+            
+        Returns:
+            Dictionary of header name to column index
+        """
+        return {header: i for i, header in enumerate(headers)}
+    
+    def _get_header_index(self, worksheet, headers: List[str]) -> Dict[str, int]:
+        """
+        Get the header index of a worksheet, building it once per header row.
+        
+        The mapping is kept in header_indexes, tied to the header list it
+        was built from, and rebuilt when the header row changes.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            headers: Cleaned header names of the worksheet
+            
+        Returns:
+            Dictionary of header name to column index
+        """
+        key = self._worksheet_key(worksheet)
+        entry = self.header_indexes.get(key)
+        if entry is None or entry[0] is not headers:
+            entry = (headers, self._header_index(headers))
+            self.header_indexes[key] = entry
+        return entry[1]
+    
+    @staticmethod
+    def _records_to_rows(
+        header_index: Dict[str, int],
+        data: List[Dict[str, Any]]
+    ) -> List[List[Any]]:
+        """
+        Convert row dictionaries into value lists in column order.
+        
+        Each row is filled from its own keys through the precomputed
+        header index, so the cost depends on the fields sent rather than
+        on the width of the sheet. Unknown keys are ignored and missing
+        columns are left empty.
+        
+        Args:
+            header_index: Header name to column index mapping
+            data: List of row data dictionaries
+            
+        Returns:
+            Rectangular list of row values
+        """
+        width = len(header_index)
+        rows = []
+        for row_data in data:
+            row = [""] * width
+            for key, value in row_data.items():
+                column = header_index.get(key)
+                if column is not None:
+                    row[column] = value
+            rows.append(row)
+        return rows
+    
+    @staticmethod
+    def _rows_update_ranges(
+        first_row_number: int,
+        header_index: Dict[str, int],
+        data: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build value ranges updating only the provided cells of consecutive rows.
+        
+        Adjacent provided columns of a row are merged into one run, and
+        the same run repeated on consecutive rows is merged into one
+        rectangle, so updating whole rows (or the same columns of every
+        row) becomes a single range. Omitted columns are left untouched.
+        
+        Args:
+            first_row_number: 1-based sheet row number of the first row
+            header_index: Header name to column index mapping
+            data: New values keyed by header, one dictionary per row
+            
+        Returns:
+            List of {"range", "values"} dictionaries for _update_values
+        """
+        # Rectangles as [first row, first column, row values]
+        rectangles: List[List[Any]] = []
+        # Rectangles reaching the previous row, keyed by (first column, width)
+        open_rectangles: Dict[Tuple[int, int], List[Any]] = {}
+        
+        for row_number, row_data in enumerate(data, start=first_row_number):
+            cells = sorted(
+                (header_index[key], value) for key, value in row_data.items() if key in header_index
+            )
+            runs: List[Tuple[int, List[Any]]] = []
+            for column, value in cells:
+                if runs and column == runs[-1][0] + len(runs[-1][1]):
+                    runs[-1][1].append(value)
+                else:
+                    runs.append((column, [value]))
+            
+            extended = {}
+            for column, values in runs:
+                span = (column, len(values))
+                rectangle = open_rectangles.get(span)
+                if rectangle is None:
+                    rectangle = [row_number, column, []]
+                    rectangles.append(rectangle)
+                rectangle[2].append(values)
+                extended[span] = rectangle
+            open_rectangles = extended
+        
+        return [
+            {
+                "range": (
+                    f"{rowcol_to_a1(row_number, column + 1)}:"
+                    f"{rowcol_to_a1(row_number + len(values) - 1, column + len(values[0]))}"
+                ),
+                "values": values,
+            }
+            for row_number, column, values in rectangles
+        ]
+    
     async def get_sheet_rows(
         self, 
         worksheet, 
@@ -260,6 +1337,12 @@ class GoogleSheetsService:
         """
         Get rows from worksheet with filtering and pagination.
         
+        Concurrent requests for the same page share one load, whatever
+        sheet identifier (ID, index, or title) they used. When
+        PREFETCH_NEXT_PAGE is enabled, returning a full page starts
+        loading the following page in the background, so a client paging
+        through the sheet finds it already fetched (or in flight).
+        
         Args:
             worksheet: Google Sheets worksheet object
             options: Options for filtering and pagination
@@ -273,27 +1356,193 @@ class GoogleSheetsService:
         if options is None:
             options = SheetGetRowsOptions()
         
+        key = self._page_key(worksheet, options)
+        records = None
+        prefetched = self.prefetched_pages.pop(key, None)
+        if prefetched is not None:
+            try:
+                records = await prefetched
+                logger.debug(f"Serving prefetched page at offset={options.offset}")
+            except Exception:
+                # Fetch again in the foreground to report the error properly
+                records = None
+        
+        if records is None:
+            records = await single_flight(
+                key,
+                lambda: self._load_sheet_rows(worksheet, options),
+                document_id=worksheet.spreadsheet_id
+            )
+        
+        if settings.PREFETCH_NEXT_PAGE and len(records) == options.limit:
+            self._prefetch_next_page(worksheet, options)
+        
+        return records
+    
+    @staticmethod
+    def _worksheet_key(worksheet) -> Tuple[Any, ...]:
+        """
+        Identify a worksheet together with the credentials reading it.
+        
+        The credentials are part of the key so data loaded for one
+        caller is never served to another.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            
+        Returns:
+            Hashable key tuple
+        """
+        return (
+            worksheet.spreadsheet_id,
+            worksheet.id,
+            token_fingerprint(getattr(worksheet.client.auth, "token", None)),
+        )
+    
+    def _page_key(self, worksheet, options: SheetGetRowsOptions) -> Tuple[Any, ...]:
+        """
+        Build the key of a page load, used for prefetching and coalescing.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            options: Options for filtering and pagination
+            
+        Returns:
+            Hashable key tuple
+        """
+        query = tuple(sorted(options.query.items())) if options.query else ()
+        return (*self._worksheet_key(worksheet), options.offset, options.limit, query)
+    
+    def _prefetch_next_page(self, worksheet, options: SheetGetRowsOptions) -> None:
+        """
+        Start loading the page after the given one in the background.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            options: Options of the page just returned
+        """
+        next_options = SheetGetRowsOptions(
+            offset=options.offset + options.limit,
+            limit=options.limit,
+            query=options.query
+        )
+        key = self._page_key(worksheet, next_options)
+        if key in self.prefetched_pages:
+            return
+        
+        task = asyncio.create_task(self._load_sheet_rows(worksheet, next_options))
+        # Retrieve the error of pages that are never requested
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self.prefetched_pages[key] = task
+    
+    async def _load_sheet_rows(
+        self,
+        worksheet,
+        options: SheetGetRowsOptions
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch rows from worksheet with filtering and pagination.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            options: Options for filtering and pagination
+            
+        Returns:
+            List of row dictionaries
+            
+        Raises:
+            HTTPException: If rows cannot be retrieved
+        """
         try:
             logger.debug(f"Getting rows with offset={options.offset}, limit={options.limit}")
             
-            # Get all records as dictionaries using safe method
-            all_records = self._get_all_records_safe(worksheet)
-            logger.debug(f"Retrieved {len(all_records)} total records")
+            records = self._rows_to_records(*await self._load_page_values(worksheet, options))
             
-            # Apply query filters if provided
+            logger.debug(f"Returning {len(records)} records")
+            return records
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error retrieving sheet rows: {str(e)}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error retrieving sheet rows: {str(e)}"
+            )
+    
+    async def _load_page_values(
+        self,
+        worksheet,
+        options: SheetGetRowsOptions
+    ) -> Tuple[List[str], List[List[Any]]]:
+        """
+        Fetch the headers and the raw values of the rows of a page.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            options: Options for filtering and pagination
+            
+        Returns:
+            tuple: (cleaned headers, raw values of the page rows)
+        """
+        # Serve the page from the whole sheet when it is already in memory
+        cached = self.sheet_values.get(self._worksheet_key(worksheet))
+        if cached is not None:
+            headers, rows = cached
             if options.query:
-                filtered_records = self._apply_filters(all_records, options.query)
-                logger.debug(f"Filtered to {len(filtered_records)} records")
-                all_records = filtered_records
+                # The first page stops filtering as soon as it is full
+                stop = options.limit if options.offset == 0 else None
+                rows = self._match_rows(worksheet, headers, rows, options.query, stop)
+            return headers, rows[options.offset:options.offset + options.limit]
+        
+        # Without filters, fetch only the requested page
+        if not options.query:
+            return await self._fetch_page(worksheet, options)
+        
+        # On large sheets, filter on the queried columns alone
+        filtered_page = await self._fetch_filtered_page(worksheet, options)
+        if filtered_page is not None:
+            return filtered_page
+        
+        # Filter the raw values, dictionaries are only built for the page
+        headers, rows = await self._get_sheet_values(worksheet)
+        logger.debug(f"Retrieved {len(rows)} total rows")
+        
+        matches = self._filter_rows(headers, rows, options.query)
+        return headers, list(islice(matches, options.offset, options.offset + options.limit))
+    
+    async def iter_sheet_rows(
+        self,
+        worksheet,
+        options: Optional[SheetGetRowsOptions] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Get rows from worksheet as a lazy iterator.
+        
+        The page is fetched (and filtered) before returning, so API
+        errors are raised here, but row dictionaries are only built as
+        the iterator is consumed. Used to stream large responses.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            options: Options for filtering and pagination
             
-            # Apply pagination
-            start_index = options.offset
-            end_index = start_index + options.limit
-            paginated_records = all_records[start_index:end_index]
+        Returns:
+            Iterator over row dictionaries
             
-            logger.debug(f"Returning {len(paginated_records)} records")
-            return paginated_records
+        Raises:
+            HTTPException: If rows cannot be retrieved
+        """
+        if options is None:
+            options = SheetGetRowsOptions()
+        
+        try:
+            headers, rows = await self._load_page_values(worksheet, options)
+            map_row = _make_row_mapper(tuple(headers))
+            return (map_row(row) for row in rows)
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error retrieving sheet rows: {str(e)}")
             raise HTTPException(
@@ -301,34 +1550,289 @@ class GoogleSheetsService:
                 detail=f"Error retrieving sheet rows: {str(e)}"
             )
     
-    def _apply_filters(self, records: List[Dict[str, Any]], filters: Dict[str, str]) -> List[Dict[str, Any]]:
+    async def _fetch_page(
+        self,
+        worksheet,
+        options: SheetGetRowsOptions
+    ) -> Tuple[List[str], List[List[Any]]]:
+        """
+        Fetch the header row and one page of row values.
+        
+        Both ranges are read with a single values.batchGet call.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            options: Pagination options
+            
+        Returns:
+            tuple: (cleaned headers, numericised row values)
+        """
+        page_range = await self._fresh_page_range(worksheet, options)
+        if page_range is None:
+            return [], []
+        
+        generation = document_generation(worksheet.spreadsheet_id)
+        header_values, rows = await self._get_ranges(worksheet, ["1:1", page_range])
+        headers = self._clean_headers(header_values[0] if header_values else [])
+        return self._store_headers(worksheet, headers, generation), _numericise_rows(rows)
+    
+    async def _fetch_filtered_page(
+        self,
+        worksheet,
+        options: SheetGetRowsOptions
+    ) -> Optional[Tuple[List[str], List[List[Any]]]]:
         """
-        Apply query filters to records.
+        Fetch one page of rows matching the query filters on a large sheet.
+        
+        Only the filtered columns are downloaded (with a single batchGet)
+        to find the matching row numbers, then only the matching rows of
+        the requested page are fetched, as runs of consecutive rows (or as
+        the span covering them when the matches are scattered over too
+        many runs). This is skipped (None is returned) for small sheets
+        and for queries matching only empty values, which need the whole
+        sheet to know where the table ends.
         
         Args:
-            records: List of record dictionaries
+            worksheet: Google Sheets worksheet object
+            options: Filter and pagination options
+            
+        Returns:
+            tuple: (cleaned headers, numericised row values), or None to use a full read
+        """
+        if worksheet.row_count * worksheet.col_count < COLUMN_FILTER_MIN_CELLS:
+            return None
+        
+        query = [(key, str(value)) for key, value in options.query.items()]
+        if all(expected == "" for _, expected in query):
+            return None
+        
+        headers = await self._get_safe_headers(worksheet)
+        filtered = [self._filter_column(headers, key) for key, expected in query if expected != ""]
+        if any(column is not None and column >= worksheet.col_count for column in filtered):
+            await self._refresh_grid(worksheet)
+        
+        # Resolve the filters to positions among the fetched columns; a
+        # column outside the grid only ever holds empty cells
+        columns: List[int] = []
+        conditions = []
+        for key, expected in query:
+            column = self._filter_column(headers, key)
+            if column is None or column >= worksheet.col_count:
+                if expected != "":
+                    return headers, []
+                continue
+            if column not in columns:
+                columns.append(column)
+            conditions.append((columns.index(column), expected))
+        
+        # Open-ended column ranges also cover rows added since the grid
+        # size was read
+        letters = [rowcol_to_a1(1, column + 1)[:-1] for column in columns]
+        column_values = await self._get_ranges(
+            worksheet, [f"{letter}2:{letter}" for letter in letters]
+        )
+        # Rows made of the filtered cells only
+        cells = zip_longest(
+            *([numericise(cell[0]) if cell else "" for cell in values] for values in column_values),
+            fillvalue=""
+        )
+        
+        # Sheet row numbers (1-based, data starts at row 2) of matching rows
+        matches = _make_row_filter(tuple(conditions), positions=True)(cells)
+        row_numbers = [
+            i + 2 for i in islice(matches, options.offset, options.offset + options.limit)
+        ]
+        if not row_numbers:
+            return headers, []
+        
+        runs = self._row_runs(row_numbers)
+        if len(runs) > MAX_ROW_RANGES:
+            runs = [(row_numbers[0], row_numbers[-1])]
+        
+        values = await self._get_ranges(worksheet, [f"{first}:{last}" for first, last in runs])
+        fetched = {
+            first + i: row
+            for (first, _), run_values in zip(runs, values)
+            for i, row in enumerate(run_values)
+        }
+        return headers, _numericise_rows([fetched.get(n, []) for n in row_numbers])
+    
+    @staticmethod
+    def _row_runs(row_numbers: List[int]) -> List[Tuple[int, int]]:
+        """
+        Group sorted row numbers into runs of consecutive rows.
+        
+        Args:
+            row_numbers: Sorted sheet row numbers
+            
+        Returns:
+            List of (first, last) row number pairs
+        """
+        runs: List[Tuple[int, int]] = []
+        for n in row_numbers:
+            if runs and runs[-1][1] == n - 1:
+                runs[-1] = (runs[-1][0], n)
+            else:
+                runs.append((n, n))
+        return runs
+    
+    async def get_many_sheet_rows(
+        self,
+        document,
+        requests: List[Tuple[Any, SheetGetRowsOptions]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Get pages of rows from several worksheets in one API call.
+        
+        The header row and the requested page of every worksheet are
+        fetched together with a single spreadsheets.values.batchGet.
+        
+        Args:
+            document: Google Spreadsheet document
+            requests: (worksheet, options) pairs to read
+            
+        Returns:
+            List of row lists, in the same order as the requests
+            
+        Raises:
+            HTTPException: If rows cannot be retrieved
+        """
+        try:
+            logger.debug(f"Batch getting rows from {len(requests)} sheets")
+            
+            # Pages past the end of their sheet are skipped
+            page_ranges = await asyncio.gather(*(
+                self._fresh_page_range(worksheet, options) for worksheet, options in requests
+            ))
+            ranges = []
+            for (worksheet, _), page_range in zip(requests, page_ranges):
+                if page_range is not None:
+                    ranges.append(absolute_range_name(worksheet.title, "1:1"))
+                    ranges.append(absolute_range_name(worksheet.title, page_range))
+            
+            value_ranges = []
+            if ranges:
+                value_ranges = await self._batch_get_values(document.client, document.id, ranges)
+            
+            results = []
+            position = 0
+            for page_range in page_ranges:
+                if page_range is None:
+                    results.append([])
+                    continue
+                header_range = value_ranges[position]
+                headers = self._clean_headers(header_range[0] if header_range else [])
+                rows = _numericise_rows(value_ranges[position + 1])
+                results.append(self._rows_to_records(headers, rows))
+                position += 2
+            
+            logger.debug(f"Batch retrieved {sum(map(len, results))} records")
+            return results
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error batch retrieving sheet rows: {str(e)}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error batch retrieving sheet rows: {str(e)}"
+            )
+    
+    @staticmethod
+    def _filter_column(headers: List[str], key: str) -> Optional[int]:
+        """
+        Find the column a filter key refers to.
+        
+        Args:
+            headers: Cleaned header names
+            key: Filter field name
+            
+        Returns:
+            Zero-based column index, or None if no column has that name
+        """
+        if key in headers:
+            return headers.index(key)
+        # Cells beyond the last header are exposed as Column_N
+        if key.startswith("Column_") and key[7:].isdigit():
+            column = int(key[7:]) - 1
+            if column >= len(headers):
+                return column
+        return None
+    
+    def _filter_rows(
+        self,
+        headers: List[str],
+        rows: List[List[Any]],
+        filters: Dict[str, str]
+    ) -> Iterator[List[Any]]:
+        """
+        Lazily yield the raw rows matching every query filter.
+        
+        Filter keys are resolved to column indices once and compiled into
+        a single predicate, so rows are compared by position without
+        building a dictionary for each. Missing cells and unknown columns
+        compare as empty strings.
+        
+        Args:
+            headers: Cleaned header names
+            rows: Raw row values
             filters: Dictionary of field filters
             
         Returns:
-            Filtered list of records
+            Iterator over matching rows
+        """
+        conditions = tuple(
+            (self._filter_column(headers, key), str(value))
+            for key, value in filters.items()
+        )
+        return _make_row_filter(conditions)(rows)
+    
+    def _match_rows(
+        self,
+        worksheet,
+        headers: List[str],
+        rows: List[List[Any]],
+        filters: Dict[str, str],
+        stop: Optional[int] = None
+    ) -> List[List[Any]]:
         """
-        filtered_records = []
+        Get the rows of an in-memory worksheet matching the query filters.
         
-        for record in records:
-            match = True
-            for key, value in filters.items():
-                if str(record.get(key, "")) != str(value):
-                    match = False
-                    break
-            if match:
-                filtered_records.append(record)
-                
-        return filtered_records
+        The result is kept in matched_rows, so paging through the same
+        query only filters the sheet once. It is tied to the row list it
+        was computed from and recomputed when the sheet is read again.
+        When stop is given and no result is kept yet, filtering ends after
+        that many matches and nothing is stored, so a client reading only
+        the first page never filters the whole sheet.
+        
+        Args:
+            worksheet: Google Sheets worksheet object
+            headers: Cleaned header names
+            rows: Raw row values held in sheet_values
+            filters: Dictionary of field filters
+            stop: Number of matches needed (optional, all by default)
+            
+        Returns:
+            List of matching rows, in sheet order
+        """
+        key = (*self._worksheet_key(worksheet), tuple(sorted(filters.items())))
+        entry = self.matched_rows.get(key)
+        if entry is None or entry[0] is not rows:
+            matches = self._filter_rows(headers, rows, filters)
+            if stop is not None:
+                return list(islice(matches, stop))
+            entry = (rows, list(matches))
+            self.matched_rows[key] = entry
+        return entry[1]
     
     async def get_sheet_info(self, worksheet) -> Dict[str, Any]:
         """
         Get comprehensive information about a worksheet.
         
+        Everything except the header row comes from the sheet properties
+        fetched when the document was opened, and the header row is
+        usually cached, so this rarely calls the API.
+        
         Args:
             worksheet: Google Sheets worksheet object
             
@@ -341,21 +1845,26 @@ class GoogleSheetsService:
         try:
             logger.debug(f"Getting info for sheet: {worksheet.title}")
             
+            properties = worksheet._properties
+            # Object sheets (charts) have no grid
+            grid = properties.get("gridProperties", {})
             sheet_info = {
                 "sheetId": worksheet.id,
                 "title": worksheet.title,
                 "index": worksheet.index,
-                "headerValues": self._get_safe_headers(worksheet),
-                "rowCount": worksheet.row_count,
-                "columnCount": worksheet.col_count,
-                "sheetType": "GRID",
-                "hidden": False,
-                "rightToLeft": False
+                "headerValues": await self._get_safe_headers(worksheet),
+                "rowCount": grid.get("rowCount", 0),
+                "columnCount": grid.get("columnCount", 0),
+                "sheetType": properties.get("sheetType", "GRID"),
+                "hidden": properties.get("hidden", False),
+                "rightToLeft": properties.get("rightToLeft", False)
             }
             
             logger.debug(f"Sheet info retrieved for: {worksheet.title}")
             return sheet_info
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error getting sheet info: {str(e)}")
             raise HTTPException(
@@ -380,14 +1889,8 @@ class GoogleSheetsService:
         try:
             logger.debug(f"Getting row {row_id} from {worksheet.title}")
             
-            all_records = self._get_all_records_safe(worksheet)
-            if row_id >= len(all_records) or row_id < 0:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Row {row_id} not found"
-                )
-            
-            return all_records[row_id]
+            headers, row = await self._get_row_values(worksheet, row_id)
+            return _make_row_mapper(tuple(headers))(row)
             
         except HTTPException:
             raise
@@ -416,27 +1919,27 @@ class GoogleSheetsService:
         try:
             logger.debug(f"Updating row {row_id} in {worksheet.title}")
             
-            # Verify row exists first
-            all_records = self._get_all_records_safe(worksheet)
-            if row_id >= len(all_records) or row_id < 0:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Row {row_id} not found"
-                )
+            # Read the headers and the row once, and verify the row exists
+            headers, row = await self._get_row_values(worksheet, row_id)
             
             # Calculate actual row number (1-indexed, +1 for header)
             actual_row_number = row_id + 2
-            headers = self._get_safe_headers(worksheet)
+            header_index = self._get_header_index(worksheet, headers)
             
-            # Update each cell in the row
-            for i, header in enumerate(headers):
-                if header in data:
-                    worksheet.update_cell(actual_row_number, i + 1, data[header])
+            # Send every changed cell with a single values.batchUpdate call
+            updates = self._rows_update_ranges(actual_row_number, header_index, [data])
+            if updates:
+                await self._update_values(worksheet, updates)
             
+            self.invalidate_worksheets(worksheet.spreadsheet_id)
             logger.info(f"Updated row {row_id} in {worksheet.title}")
             
-            # Return updated row
-            return await self.get_row(worksheet, row_id)
+            # Return the row with the new values applied, without re-reading it
+            record = _make_row_mapper(tuple(headers))(row)
+            record.update(
+                (key, numericise(value)) for key, value in data.items() if key in header_index
+            )
+            return record
             
         except HTTPException:
             raise
@@ -464,20 +1967,22 @@ class GoogleSheetsService:
         try:
             logger.debug(f"Creating new row in {worksheet.title}")
             
-            headers = self._get_safe_headers(worksheet)
+            headers = await self._get_safe_headers(worksheet)
             
             # Prepare row data in the correct column order
-            row_data = [data.get(header, "") for header in headers]
+            row_data, = self._records_to_rows(self._get_header_index(worksheet, headers), [data])
             
             # Append the row
-            worksheet.append_row(row_data)
+            await self._append_values(worksheet, [row_data])
             
+            self.invalidate_worksheets(worksheet.spreadsheet_id)
             logger.info(f"Created new row in {worksheet.title}")
             
-            # Return the created row (get the last row)
-            all_records = self._get_all_records_safe(worksheet)
-            return all_records[-1] if all_records else {}
+            # Return the created row as written, without re-reading the sheet
+            return _make_row_mapper(tuple(headers))(numericise_all(row_data))
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error creating row: {str(e)}")
             raise HTTPException(
@@ -503,19 +2008,26 @@ class GoogleSheetsService:
         try:
             logger.debug(f"Bulk updating {len(data)} rows starting from {start_row_id}")
             
-            headers = self._get_safe_headers(worksheet)
+            headers = await self._get_safe_headers(worksheet)
+            header_index = self._get_header_index(worksheet, headers)
             
-            for i, row_data in enumerate(data):
-                actual_row_number = start_row_id + i + 2  # +1 for 1-indexing, +1 for header
-                
-                # Update each cell in the row
-                for j, header in enumerate(headers):
-                    if header in row_data:
-                        worksheet.update_cell(actual_row_number, j + 1, row_data[header])
+            # Send every changed cell with one values.batchUpdate call per batch
+            # of rows, rows updating the same columns sharing one range
+            for batch_start in range(0, len(data), WRITE_BATCH_SIZE):
+                updates = self._rows_update_ranges(
+                    start_row_id + batch_start + 2,  # +1 for 1-indexing, +1 for header
+                    header_index,
+                    data[batch_start:batch_start + WRITE_BATCH_SIZE]
+                )
+                if updates:
+                    await self._update_values(worksheet, updates)
             
+            self.invalidate_worksheets(worksheet.spreadsheet_id)
             logger.info(f"Bulk updated {len(data)} rows in {worksheet.title}")
             return len(data)
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error updating rows in bulk: {str(e)}")
             raise HTTPException(
@@ -540,20 +2052,23 @@ class GoogleSheetsService:
         try:
             logger.debug(f"Bulk creating {len(data)} rows")
             
-            headers = self._get_safe_headers(worksheet)
+            headers = await self._get_safe_headers(worksheet)
             
             # Prepare all rows data in correct column order
-            rows_data = []
-            for row_data in data:
-                row = [row_data.get(header, "") for header in headers]
-                rows_data.append(row)
+            rows_data = self._records_to_rows(self._get_header_index(worksheet, headers), data)
             
-            # Append all rows at once
-            worksheet.append_rows(rows_data)
+            # Append rows with one values.append call per batch
+            for batch_start in range(0, len(rows_data), WRITE_BATCH_SIZE):
+                await self._append_values(
+                    worksheet, rows_data[batch_start:batch_start + WRITE_BATCH_SIZE]
+                )
             
+            self.invalidate_worksheets(worksheet.spreadsheet_id)
             logger.info(f"Bulk created {len(data)} rows in {worksheet.title}")
             return len(data)
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error creating rows in bulk: {str(e)}")
             raise HTTPException(
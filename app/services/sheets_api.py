@@ -0,0 +1,158 @@
+"""
+Async Google Sheets REST client module.
+
+This module provides a minimal asynchronous client for the Google Sheets
+values API built on httpx. Unlike gspread, which uses blocking requests,
+calls made through it never block the event loop, and concurrent calls
+share HTTP/2 connections.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+import gspread
+import httpx
+
+from app.config import settings
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+# Base URL of the Google Sheets API
+SHEETS_API_URL = "https://sheets.googleapis.com/v4/"
+
+# Seconds to wait for a Google Sheets API response
+SHEETS_API_TIMEOUT = 30.0
+
+
+class AsyncSheetsClient:
+    """
+    Asynchronous client for the Google Sheets values API.
+
+    Requests are authenticated with the credentials of a gspread client
+    (OAuth2 token or API key), so it can stand in for gspread on hot value
+    read and write paths. Error responses raise gspread's APIError, so callers handle
+    both transports the same way.
+
+    Example:
+        api = AsyncSheetsClient()
+        response = await api.values_batch_get(document_id, ["Sheet1!1:1"], auth)
+        await api.aclose()
+    """
+
+    def __init__(self):
+        """Initialize the client and its HTTP/2 connection pool."""
+        self.http = httpx.AsyncClient(
+            base_url=SHEETS_API_URL,
+            http2=True,
+            timeout=SHEETS_API_TIMEOUT,
+            limits=httpx.Limits(max_connections=settings.SHEETS_POOL_MAXSIZE),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying connections."""
+        await self.http.aclose()
+
+    async def values_batch_get(
+        self,
+        spreadsheet_id: str,
+        ranges: List[str],
+        auth: Any,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Read several ranges with spreadsheets.values.batchGet.
+
+        Args:
+            spreadsheet_id: Google Spreadsheet document ID
+            ranges: Ranges in A1 notation (including the sheet title)
+            auth: google-auth credentials of the calling gspread client
+            params: Additional query parameters (render options, ...)
+
+        Returns:
+            batchGet response body
+
+        Raises:
+            gspread.exceptions.APIError: If the API returns an error
+        """
+        headers: Dict[str, str] = {}
+        auth.apply(headers)
+
+        response = await self.http.get(
+            f"spreadsheets/{spreadsheet_id}/values:batchGet",
+            params={**(params or {}), "ranges": ranges},
+            headers=headers,
+        )
+        if response.is_error:
+            raise gspread.exceptions.APIError(response)
+        return response.json()
+
+    async def values_append(
+        self,
+        spreadsheet_id: str,
+        range_name: str,
+        auth: Any,
+        params: Dict[str, Any],
+        body: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Append rows after the table found in a range with spreadsheets.values.append.
+
+        Args:
+            spreadsheet_id: Google Spreadsheet document ID
+            range_name: Range in A1 notation (including the sheet title)
+            auth: google-auth credentials of the calling gspread client
+            params: Query parameters (value input option, ...)
+            body: ValueRange request body
+
+        Returns:
+            values.append response body
+
+        Raises:
+            gspread.exceptions.APIError: If the API returns an error
+        """
+        headers: Dict[str, str] = {}
+        auth.apply(headers)
+
+        response = await self.http.post(
+            f"spreadsheets/{spreadsheet_id}/values/{quote(range_name, safe='')}:append",
+            params=params,
+            json=body,
+            headers=headers,
+        )
+        if response.is_error:
+            raise gspread.exceptions.APIError(response)
+        return response.json()
+
+    async def values_batch_update(
+        self,
+        spreadsheet_id: str,
+        auth: Any,
+        body: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Write several ranges with spreadsheets.values.batchUpdate.
+
+        Args:
+            spreadsheet_id: Google Spreadsheet document ID
+            auth: google-auth credentials of the calling gspread client
+            body: BatchUpdateValuesRequest body (value input option and data)
+
+        Returns:
+            values.batchUpdate response body
+
+        Raises:
+            gspread.exceptions.APIError: If the API returns an error
+        """
+        headers: Dict[str, str] = {}
+        auth.apply(headers)
+
+        response = await self.http.post(
+            f"spreadsheets/{spreadsheet_id}/values:batchUpdate",
+            json=body,
+            headers=headers,
+        )
+        if response.is_error:
+            raise gspread.exceptions.APIError(response)
+        return response.json()
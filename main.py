@@ -16,5 +16,8 @@ if __name__ == "__main__":
         host=settings.HOST,
         port=settings.PORT,
         reload=settings.DEBUG,
+        workers=settings.WORKERS,
+        loop="uvloop",
+        http="httptools",
         log_level=settings.LOG_LEVEL.lower()
     )
@@ -0,0 +1,58 @@
+"""
+Tests for the shared API helpers.
+"""
+
+import pytest
+from starlette.requests import Request
+
+from app.api.utils import etag_response
+
+
+def _request(if_none_match=None):
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+CONTENT = [{"name": "ann", "age": 30}]
+
+
+def _etag(content=CONTENT):
+    return etag_response(_request(), content).headers["etag"]
+
+
+def test_sends_weak_etag_and_cache_control():
+    response = etag_response(_request(), CONTENT)
+    assert response.status_code == 200
+    assert response.body == b'[{"name":"ann","age":30}]'
+    assert response.headers["etag"].startswith('W/"')
+    assert response.headers["cache-control"].startswith("private, max-age=")
+
+
+def test_etag_depends_on_content():
+    assert _etag() == _etag([{"name": "ann", "age": 30}])
+    assert _etag() != _etag([{"name": "ann", "age": 31}])
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "{etag}",
+    "{strong}",
+    '"other", {etag}',
+    '"other",{strong}',
+    "*",
+])
+def test_matching_if_none_match_is_not_modified(if_none_match):
+    etag = _etag()
+    header = if_none_match.format(etag=etag, strong=etag.removeprefix("W/"))
+    response = etag_response(_request(header), CONTENT)
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.parametrize("if_none_match", ['"other"', 'W/"other"', ""])
+def test_other_if_none_match_returns_body(if_none_match):
+    response = etag_response(_request(if_none_match), CONTENT)
+    assert response.status_code == 200
+    assert response.body == b'[{"name":"ann","age":30}]'
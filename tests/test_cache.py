@@ -0,0 +1,125 @@
+"""
+Tests for request coalescing and invalidation of the response cache.
+"""
+
+import asyncio
+
+import pytest
+from cachetools import TLRUCache
+
+from app.services import cache
+from app.services.sheets import GoogleSheetsService
+
+
+DOCUMENT_ID = "doc"
+KEY = cache.make_cache_key(DOCUMENT_ID, "0", None, "rows", 0, 100)
+
+
+@pytest.fixture(autouse=True)
+def local_cache(monkeypatch):
+    """Use an empty in-process cache and no Redis."""
+    local = TLRUCache(maxsize=16, ttu=lambda _key, entry, now: now + entry[0])
+    monkeypatch.setattr(cache, "redis_client", None)
+    monkeypatch.setattr(cache, "local_cache", local)
+    return local
+
+
+def _read(loader):
+    """Read KEY like the row endpoints do."""
+    return cache.single_flight(
+        KEY,
+        lambda: cache.cache_get_or_set(KEY, loader, 60, document_id=DOCUMENT_ID),
+        document_id=DOCUMENT_ID
+    )
+
+
+async def test_concurrent_reads_share_one_load():
+    calls = []
+    release = asyncio.Event()
+
+    async def load():
+        calls.append(1)
+        await release.wait()
+        return "value"
+
+    first = asyncio.create_task(_read(load))
+    second = asyncio.create_task(_read(load))
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(first, second) == ["value", "value"]
+    assert calls == [1]
+
+
+async def test_read_after_invalidation_does_not_join_earlier_load(local_cache):
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def load_old():
+        started.set()
+        await release.wait()
+        return "old"
+
+    async def load_new():
+        return "new"
+
+    # A read starts before the write and is still loading afterwards
+    before_write = asyncio.create_task(_read(load_old))
+    await started.wait()
+    await cache.invalidate_document_cache(DOCUMENT_ID)
+
+    assert await _read(load_new) == "new"
+    release.set()
+    assert await before_write == "old"
+
+    # The value read before the write is not cached over the new one
+    assert local_cache[KEY][1] == "new"
+    assert await _read(load_old) == "new"
+
+
+async def test_value_loaded_across_invalidation_is_not_cached(local_cache):
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def load_old():
+        started.set()
+        await release.wait()
+        return "old"
+
+    before_write = asyncio.create_task(_read(load_old))
+    await started.wait()
+    await cache.invalidate_document_cache(DOCUMENT_ID)
+    release.set()
+    assert await before_write == "old"
+    assert KEY not in local_cache
+
+
+class _Worksheet:
+    spreadsheet_id = DOCUMENT_ID
+    id = 1
+    row_count = 10
+
+    class client:
+        auth = None
+
+
+async def test_sheet_values_read_before_write_are_not_stored():
+    service = GoogleSheetsService()
+    worksheet = _Worksheet()
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def get_ranges(_worksheet, _ranges):
+        started.set()
+        await release.wait()
+        return [[["name"], ["old"]]]
+
+    service._get_ranges = get_ranges
+    before_write = asyncio.create_task(service._get_sheet_values(worksheet))
+    await started.wait()
+    service.invalidate_worksheets(DOCUMENT_ID)
+    release.set()
+    assert await before_write == (["name"], [["old"]])
+
+    key = service._worksheet_key(worksheet)
+    assert key not in service.sheet_values
+    assert key not in service.header_cache
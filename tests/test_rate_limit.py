@@ -0,0 +1,71 @@
+"""
+Tests for the asyncio token bucket pacing Google Sheets API calls.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import rate_limit
+from app.services.rate_limit import AsyncTokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the bucket's clock and sleep with a manually advanced clock."""
+    clock = SimpleNamespace(now=100.0, sleeps=[])
+
+    async def sleep(delay):
+        clock.sleeps.append(delay)
+        clock.now += delay
+        await asyncio.sleep(0)
+
+    monkeypatch.setattr(rate_limit, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    monkeypatch.setattr(rate_limit, "asyncio", SimpleNamespace(Lock=asyncio.Lock, sleep=sleep))
+    return clock
+
+
+async def test_burst_up_to_capacity_does_not_wait(clock):
+    bucket = AsyncTokenBucket(rate=5.0)
+    for _ in range(5):
+        await bucket.acquire()
+    assert clock.sleeps == []
+
+
+async def test_waits_for_the_next_token(clock):
+    bucket = AsyncTokenBucket(rate=5.0)
+    for _ in range(6):
+        async with bucket:
+            pass
+    assert clock.sleeps == [pytest.approx(0.2)]
+
+
+async def test_refill_is_capped_at_capacity(clock):
+    bucket = AsyncTokenBucket(rate=2.0, capacity=2)
+    await bucket.acquire()
+    await bucket.acquire()
+    clock.now += 60
+    for _ in range(3):
+        await bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+async def test_zero_rate_disables_limiting(clock):
+    bucket = AsyncTokenBucket(rate=0)
+    for _ in range(100):
+        await bucket.acquire()
+    assert clock.sleeps == []
+
+
+async def test_waiters_are_served_in_arrival_order(clock):
+    bucket = AsyncTokenBucket(rate=1.0)
+    order = []
+
+    async def call(n):
+        async with bucket:
+            order.append(n)
+
+    await asyncio.gather(*(call(n) for n in range(4)))
+    assert order == [0, 1, 2, 3]
+    assert sum(clock.sleeps) == pytest.approx(3.0)
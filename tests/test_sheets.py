@@ -0,0 +1,398 @@
+"""
+Tests for the Google Sheets service.
+"""
+
+import math
+import random
+from itertools import product
+
+import gspread
+import pytest
+from fastapi import HTTPException
+from google.auth.exceptions import RefreshError
+from gspread.utils import a1_range_to_grid_range
+from tenacity import wait_none
+
+from app.config import settings
+from app.models import SheetGetRowsOptions
+from app.services import sheets
+from app.services.rate_limit import AsyncTokenBucket
+from app.services.sheets import GoogleSheetsService, _make_row_filter, _make_row_mapper
+
+
+# Numericised cell values, as produced by gspread's numericise
+CELLS = [
+    "", "x", "30", "30.0", "nan", "True",
+    0, 1, 30, -5, 10**20,
+    0.0, -0.0, 0.5, 30.0, 1e20, 1e-7, math.nan, math.inf, -math.inf,
+    True, False,
+]
+
+EXPECTED = sorted({str(cell) for cell in CELLS} | {"0", "-0", "1.0", "+1", "1e20", "inf", "NaN"})
+
+
+def _str_match(row, column, expected):
+    """Reference semantics: compare the string form, missing cells as empty."""
+    cell = row[column] if column < len(row) else ""
+    return str(cell) == expected
+
+
+class TestRowMapper:
+
+    def test_maps_cells_to_headers(self):
+        mapper = _make_row_mapper(("name", "age"))
+        assert mapper(["ann", 30]) == {"name": "ann", "age": 30}
+
+    def test_pads_short_rows(self):
+        mapper = _make_row_mapper(("name", "age", "city"))
+        assert mapper(["ann"]) == {"name": "ann", "age": "", "city": ""}
+        assert mapper([]) == {"name": "", "age": "", "city": ""}
+
+    def test_keys_extra_cells_as_column_n(self):
+        mapper = _make_row_mapper(("name",))
+        assert mapper(["ann", 30, "x"]) == {"name": "ann", "Column_2": 30, "Column_3": "x"}
+
+    def test_headers_are_not_evaluated(self):
+        headers = ("it's", 'say "hi"', "{row}", "a\\nb")
+        mapper = _make_row_mapper(headers)
+        assert mapper([1, 2, 3, 4]) == dict(zip(headers, [1, 2, 3, 4]))
+
+
+class TestRowFilter:
+
+    @pytest.mark.parametrize("expected", EXPECTED)
+    def test_matches_like_str(self, expected):
+        rows = [[cell] for cell in CELLS]
+        matched = list(_make_row_filter(((0, expected),))(rows))
+        assert matched == [row for row in rows if _str_match(row, 0, expected)]
+
+    @pytest.mark.parametrize("expected", ["", "x", "30", "0.0"])
+    def test_short_rows_compare_as_empty(self, expected):
+        rows = [[], ["a"], ["a", ""], ["a", "x"], ["a", 30], ["a", 0.0]]
+        matched = list(_make_row_filter(((1, expected),))(rows))
+        assert matched == [row for row in rows if _str_match(row, 1, expected)]
+
+    def test_all_conditions_must_match(self):
+        rows = [[cell, other] for cell, other in product(CELLS, [30, "30", 30.0, ""])]
+        conditions = ((0, "30"), (1, "30.0"))
+        matched = list(_make_row_filter(conditions)(rows))
+        assert matched == [
+            row for row in rows
+            if _str_match(row, 0, "30") and _str_match(row, 1, "30.0")
+        ]
+
+    def test_unknown_column_only_matches_empty(self):
+        rows = [["a"], ["b"]]
+        assert list(_make_row_filter(((None, ""),))(rows)) == rows
+        assert list(_make_row_filter(((None, "a"),))(rows)) == []
+
+    def test_positions(self):
+        rows = [[30], ["x"], [30.0], ["30"]]
+        assert list(_make_row_filter(((0, "30"),), positions=True)(rows)) == [0, 3]
+
+
+class TestRowsUpdateRanges:
+
+    HEADER_INDEX = {"a": 0, "b": 1, "c": 2, "d": 3, "e": 4}
+
+    @staticmethod
+    def _apply(ranges):
+        """Write value ranges onto an empty grid, keyed by (row, column)."""
+        written = {}
+        for value_range in ranges:
+            grid = a1_range_to_grid_range(value_range["range"])
+            height = grid["endRowIndex"] - grid["startRowIndex"]
+            width = grid["endColumnIndex"] - grid["startColumnIndex"]
+            assert len(value_range["values"]) == height
+            for i, row in enumerate(value_range["values"]):
+                assert len(row) == width
+                for j, value in enumerate(row):
+                    cell = (grid["startRowIndex"] + 1 + i, grid["startColumnIndex"] + j)
+                    assert cell not in written
+                    written[cell] = value
+        return written
+
+    @pytest.mark.parametrize("data", [
+        [{"a": 1, "b": 2, "c": 3, "d": 4, "e": 5}],
+        [{"a": 1, "c": 3}],
+        [{"b": 1, "c": 2}, {"b": 3, "c": 4}, {"b": 5, "c": 6}],
+        [{"a": 1, "b": 2}, {"a": 3}, {"a": 4, "b": 5}],
+        [{"a": 1, "b": 2}, {"b": 3, "c": 4}, {"d": 5}],
+        [{"a": 1}, {}, {"a": 2}],
+        [{"e": 1, "a": 2}, {"a": 3, "e": 4}],
+        [{"a": 1, "unknown": 2}],
+        [{}],
+    ])
+    def test_writes_exactly_the_provided_cells(self, data):
+        ranges = GoogleSheetsService._rows_update_ranges(5, self.HEADER_INDEX, data)
+        written = self._apply(ranges)
+        assert written == {
+            (row_number, self.HEADER_INDEX[key]): value
+            for row_number, row_data in enumerate(data, start=5)
+            for key, value in row_data.items()
+            if key in self.HEADER_INDEX
+        }
+
+    def test_merges_repeated_columns_into_one_range(self):
+        data = [{"a": i, "b": i, "c": i} for i in range(3)]
+        ranges = GoogleSheetsService._rows_update_ranges(2, self.HEADER_INDEX, data)
+        assert ranges == [{"range": "A2:C4", "values": [[0, 0, 0], [1, 1, 1], [2, 2, 2]]}]
+
+    def test_gap_splits_ranges(self):
+        ranges = GoogleSheetsService._rows_update_ranges(2, self.HEADER_INDEX, [{"a": 1, "c": 3}])
+        assert ranges == [
+            {"range": "A2:A2", "values": [[1]]},
+            {"range": "C2:C2", "values": [[3]]},
+        ]
+
+
+class _Worksheet:
+    spreadsheet_id = "doc"
+    id = 1
+    title = "Sheet1"
+    row_count = 1000
+    col_count = 26
+
+    class client:
+        auth = None
+
+
+class TestBlankRows:
+
+    # Row 3 of the sheet (row_id 1) is blank, the table ends at row 4
+    GRID = [["name", "age"], ["ann", "30"], [], ["bob", "40"]]
+
+    @pytest.fixture
+    def service(self):
+        service = GoogleSheetsService()
+        service.updates = []
+
+        async def get_ranges(_worksheet, ranges):
+            values = []
+            for range_name in ranges:
+                if range_name is None:
+                    values.append([list(row) for row in self.GRID])
+                    continue
+                first, last = (int(n) for n in range_name.split(":"))
+                rows = [list(row) for row in self.GRID[first - 1:last]]
+                while rows and not rows[-1]:
+                    rows.pop()
+                values.append(rows)
+            return values
+
+        async def update_values(_worksheet, data):
+            service.updates.extend(data)
+
+        service._get_ranges = get_ranges
+        service._update_values = update_values
+        return service
+
+    @pytest.mark.parametrize("cached_headers", [False, True])
+    async def test_blank_row_inside_table_is_returned(self, service, cached_headers):
+        worksheet = _Worksheet()
+        if cached_headers:
+            await service._get_safe_headers(worksheet)
+        assert await service.get_row(worksheet, 1) == {"name": "", "age": ""}
+
+    async def test_blank_row_from_sheet_values_is_returned(self, service):
+        worksheet = _Worksheet()
+        await service._get_sheet_values(worksheet)
+        assert await service.get_row(worksheet, 1) == {"name": "", "age": ""}
+
+    async def test_blank_row_inside_table_can_be_updated(self, service):
+        record = await service.update_row(_Worksheet(), 1, {"name": "cat"})
+        assert record == {"name": "cat", "age": ""}
+        assert service.updates == [{"range": "A3:A3", "values": [["cat"]]}]
+
+    @pytest.mark.parametrize("row_id", [3, 10, -1])
+    async def test_row_below_table_is_not_found(self, service, row_id):
+        with pytest.raises(HTTPException) as error:
+            await service.get_row(_Worksheet(), row_id)
+        assert error.value.status_code == 404
+
+
+class _Response:
+    """Minimal requests response carrying a Sheets API error."""
+
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = ""
+
+    def json(self):
+        return {"error": {"code": self.status_code, "message": "error", "status": "ERROR"}}
+
+
+def _api_error(status_code, **headers):
+    return gspread.exceptions.APIError(_Response(status_code, headers))
+
+
+class TestCall:
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch):
+        monkeypatch.setattr(sheets, "wait_random_exponential", lambda **_: wait_none())
+        monkeypatch.setattr(settings, "SHEETS_RETRY_ATTEMPTS", 3)
+        monkeypatch.setattr(settings, "SHEETS_RETRY_MAX_WAIT", 16)
+
+    @staticmethod
+    def _failing(*errors, result="ok"):
+        """Build an API operation raising the given errors, then returning result."""
+        calls = []
+
+        def operation():
+            calls.append(1)
+            if len(calls) <= len(errors):
+                raise errors[len(calls) - 1]
+            return result
+
+        operation.calls = calls
+        return operation
+
+    async def _call(self, service, operation, **kwargs):
+        return await service._call(AsyncTokenBucket(rate=0), operation, **kwargs)
+
+    @pytest.mark.parametrize("status_code", [429, 500, 503])
+    async def test_transient_errors_are_retried(self, status_code):
+        service = GoogleSheetsService()
+        operation = self._failing(_api_error(status_code))
+        assert await self._call(service, operation) == "ok"
+        assert len(operation.calls) == 2
+        assert service.get_api_stats() == {
+            "calls": {"operation": 2}, "retries": {"operation": 1}
+        }
+
+    async def test_coroutine_operations_are_retried(self):
+        errors = [_api_error(503)]
+
+        async def operation():
+            if errors:
+                raise errors.pop()
+            return "ok"
+
+        assert await self._call(GoogleSheetsService(), operation) == "ok"
+
+    @pytest.mark.parametrize("status_code, headers, retry_after", [
+        (429, {"Retry-After": "7"}, "7"),
+        (429, {}, "16"),
+        (503, {}, "16"),
+    ])
+    async def test_exhausted_retries_map_to_http_errors(self, status_code, headers, retry_after):
+        operation = self._failing(*[_api_error(status_code, **headers)] * 3)
+        with pytest.raises(HTTPException) as error:
+            await self._call(GoogleSheetsService(), operation)
+        assert error.value.status_code == (429 if status_code == 429 else 503)
+        assert error.value.headers == {"Retry-After": retry_after}
+        assert len(operation.calls) == 3
+
+    async def test_other_errors_are_raised_without_retry(self):
+        operation = self._failing(_api_error(400))
+        with pytest.raises(gspread.exceptions.APIError):
+            await self._call(GoogleSheetsService(), operation)
+        assert len(operation.calls) == 1
+
+    @pytest.mark.parametrize("error", [_api_error(401), RefreshError("expired")])
+    async def test_rejected_credentials_map_to_401(self, error):
+        operation = self._failing(error)
+        with pytest.raises(HTTPException) as raised:
+            await self._call(GoogleSheetsService(), operation)
+        assert raised.value.status_code == 401
+        assert len(operation.calls) == 1
+
+    async def test_retry_if_limits_retried_errors(self):
+        operation = self._failing(_api_error(503))
+        with pytest.raises(gspread.exceptions.APIError):
+            await self._call(
+                GoogleSheetsService(), operation, retry_if=sheets._is_quota_error
+            )
+        assert len(operation.calls) == 1
+
+        operation = self._failing(_api_error(429))
+        assert await self._call(
+            GoogleSheetsService(), operation, retry_if=sheets._is_quota_error
+        ) == "ok"
+
+
+def _grid_values(grid, range_name):
+    """Read a range of a grid of formatted values like the values API."""
+    if range_name is None:
+        values = [list(row) for row in grid]
+    else:
+        bounds = a1_range_to_grid_range(range_name)
+        values = [
+            list(row[bounds.get("startColumnIndex", 0):bounds.get("endColumnIndex")])
+            for row in grid[bounds.get("startRowIndex", 0):bounds.get("endRowIndex")]
+        ]
+    # Trailing empty cells and rows are omitted
+    for row in values:
+        while row and row[-1] == "":
+            row.pop()
+    while values and not values[-1]:
+        values.pop()
+    return values
+
+
+class TestFilteredPage:
+
+    HEADERS = ["name", "age", "city", "flag"]
+    CELLS = ["30", "30.0", "40", "x", "", "TRUE", "1,000", "0.0", "-0", "nan"]
+
+    @pytest.fixture(scope="class")
+    def grid(self):
+        generator = random.Random(1)
+        rows = [
+            [f"n{i}"] + [generator.choice(self.CELLS) for _ in range(3)]
+            for i in range(300)
+        ]
+        rows[150] = []
+        return [self.HEADERS] + [row[:generator.randint(1, 4)] for row in rows]
+
+    @staticmethod
+    def _baseline(grid, options):
+        """Rows as get_all_records plus _apply_filters returned them."""
+        width = len(grid[0])
+        records = [
+            dict(zip(grid[0], gspread.utils.numericise_all(row + [""] * (width - len(row)))))
+            for row in _grid_values(grid, None)[1:]
+        ]
+        matches = [
+            record for record in records
+            if all(str(record.get(key, "")) == str(value) for key, value in options.query.items())
+        ]
+        return matches[options.offset:options.offset + options.limit]
+
+    @pytest.mark.parametrize("query", [
+        {"age": "30"},
+        {"age": "30.0"},
+        {"age": "1000"},
+        {"city": "TRUE"},
+        {"age": "0.0"},
+        {"age": "0"},
+        {"city": "nan"},
+        {"age": "40", "city": "x"},
+        {"age": "30", "flag": ""},
+        {"age": "", "city": ""},
+        {"unknown": "1"},
+        {"unknown": ""},
+    ])
+    @pytest.mark.parametrize("offset, limit", [(0, 5), (3, 50), (0, 1000)])
+    async def test_matches_get_all_records_filtering(
+        self, monkeypatch, grid, query, offset, limit
+    ):
+        monkeypatch.setattr(sheets, "COLUMN_FILTER_MIN_CELLS", 0)
+        service = GoogleSheetsService()
+        ranges = []
+
+        async def get_ranges(_worksheet, range_names):
+            ranges.extend(range_names)
+            return [_grid_values(grid, range_name) for range_name in range_names]
+
+        service._get_ranges = get_ranges
+        options = SheetGetRowsOptions(offset=offset, limit=limit, query=query)
+        records = await service.get_sheet_rows(_Worksheet(), options)
+
+        # Compared by repr, since nan cells never compare equal
+        assert repr(records) == repr(self._baseline(grid, options))
+        if any(value != "" for value in query.values()):
+            # Served from the filtered columns, never the whole sheet
+            assert None not in ranges